@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for skilltool
+
+Runs each benchmarked command in fresh `python -X importtime` processes and
+records the median wall time and total import time. Results can be saved as a
+baseline and later runs compared against it, so an eager import that sneaks
+back in shows up as a failed check instead of a slow hook.
+
+Usage:
+    python bench_startup.py [--runs N] [--save baseline.json] [--baseline baseline.json]
+
+Examples:
+    python bench_startup.py --save bench-baseline.json
+    python bench_startup.py --baseline bench-baseline.json --threshold 0.25
+"""
+
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+SKILLTOOL = SCRIPTS_DIR / 'skilltool.py'
+
+# Commands hooks run most often; validate runs against this skill itself
+BENCH_COMMANDS = {
+    'help': ['--help'],
+    'init --help': ['init', '--help'],
+    'validate --help': ['validate', '--help'],
+    'package --help': ['package', '--help'],
+    'inspect --help': ['inspect', '--help'],
+    'validate': ['validate', str(SCRIPTS_DIR.parent)],
+}
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+# Measurements below this are dominated by noise; don't flag them as regressions
+MIN_REGRESSION_MS = 2.0
+
+
+def parse_importtime(stderr):
+    """
+    Summarize `python -X importtime` output.
+
+    Returns:
+        Tuple of (total import time in ms, module count, dict of top-level
+        module -> cumulative ms)
+    """
+    total_us = 0
+    modules = 0
+    top_level = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        total_us += int(self_us)
+        modules += 1
+        if len(indent) == 1:
+            top_level[module] = int(cumulative_us) / 1000
+    return total_us / 1000, modules, top_level
+
+
+def measure(args, runs):
+    """Run `skilltool <args>` in `runs` fresh processes and return summary stats."""
+    wall_ms, import_ms, module_counts = [], [], []
+    top_level = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', str(SKILLTOOL), *args],
+            capture_output=True, text=True, cwd=SCRIPTS_DIR,
+        )
+        wall_ms.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            # A crash on startup (e.g. a broken lazy import) would otherwise look fast
+            errors = [line for line in result.stderr.splitlines() if not IMPORTTIME_RE.match(line)]
+            raise RuntimeError(errors[-1] if errors else f"exit code {result.returncode}")
+        total, modules, top_level = parse_importtime(result.stderr)
+        import_ms.append(total)
+        module_counts.append(modules)
+
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        'wall_ms': round(statistics.median(wall_ms), 2),
+        'import_ms': round(statistics.median(import_ms), 2),
+        'modules': max(module_counts),
+        'slowest_imports': {name: round(ms, 2) for name, ms in slowest},
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results to a baseline.
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('wall_ms', 'import_ms'):
+            before, after = previous[metric], current[metric]
+            if after - before > max(before * threshold, MIN_REGRESSION_MS):
+                regressions.append(f"{name}: {metric} {before:.1f} -> {after:.1f} ms")
+        if current['modules'] > previous['modules']:
+            regressions.append(
+                f"{name}: imports {current['modules'] - previous['modules']} more modules "
+                f"({previous['modules']} -> {current['modules']})"
+            )
+    return regressions
+
+
+def run_bench(runs=10, save_path=None, baseline_path=None, threshold=0.2):
+    """
+    Benchmark every command in BENCH_COMMANDS.
+
+    Returns:
+        Process exit code: 1 if a command failed or regressed against the baseline
+    """
+    print(f"⏱️  Benchmarking skilltool cold start ({runs} runs per command)\n")
+    print(f"  {'command':<18} {'wall':>9} {'imports':>9} {'modules':>8}")
+
+    results, failed = {}, []
+    for name, args in BENCH_COMMANDS.items():
+        try:
+            results[name] = measure(args, runs)
+        except RuntimeError as e:
+            failed.append(name)
+            print(f"  {name:<18} ❌ {e}")
+            continue
+        r = results[name]
+        print(f"  {name:<18} {r['wall_ms']:>7.1f}ms {r['import_ms']:>7.1f}ms {r['modules']:>8}")
+
+    if save_path:
+        payload = {'python': sys.version.split()[0], 'runs': runs, 'commands': results}
+        Path(save_path).write_text(json.dumps(payload, indent=2) + '\n')
+        print(f"\n✅ Results saved to: {save_path}")
+
+    if failed:
+        print(f"\n❌ {len(failed)} command(s) failed: {', '.join(failed)}")
+        return 1
+
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text())
+        regressions = compare(results, baseline.get('commands', {}), threshold)
+        if regressions:
+            print(f"\n❌ Regressions vs {baseline_path} (threshold {threshold:.0%}):")
+            for message in regressions:
+                print(f"   {message}")
+            for name in {message.split(':')[0] for message in regressions}:
+                slowest = ', '.join(f"{m} {ms:.1f}ms" for m, ms in results[name]['slowest_imports'].items())
+                print(f"   {name} slowest imports: {slowest}")
+            return 1
+        print(f"\n✅ No regressions vs {baseline_path}")
+
+    return 0
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark skilltool cold-start time")
+    parser.add_argument('--runs', type=int, default=10, help="Fresh processes per command (default: 10)")
+    parser.add_argument('--save', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed slowdown as a fraction (default: 0.2)")
+    args = parser.parse_args()
+    sys.exit(run_bench(args.runs, args.save, args.baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Workload benchmarks for the repo's Python tooling
+
+Generates synthetic inputs far bigger than the real skill library and times the
+tools on them: package_skill() on a 10,000-file skill tree, validate_skill() on
+multi-megabyte SKILL.md files and on 1,000 skills, init_skill() creating 1,000
+skills, and the <script setup> extraction shared by build_admin_dashboard.py
+(sfc.py) on huge and pathological .vue files.
+
+Each run of a workload happens in a fresh process, so peak RSS belongs to that
+workload alone. Results record the median wall time, the highest peak RSS and
+the throughput, and can be saved as a baseline that later runs are compared
+against. Inputs are generated once per --workdir and scale, and reused.
+
+Usage:
+    python bench_tools.py [--runs N] [--scale X] [--only <workload> ...]
+                          [--workdir <dir>] [--save results.json] [--baseline results.json]
+
+Examples:
+    python bench_tools.py --save bench-tools-baseline.json
+    python bench_tools.py --baseline bench-tools-baseline.json --threshold 0.25
+    python bench_tools.py --scale 0.1 --only package-10k-files
+"""
+
+import json
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_startup import MIN_REGRESSION_MS
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Peak RSS growth below this is allocator noise; don't flag it as a regression
+MIN_REGRESSION_RSS_KB = 4 * 1024
+
+WORDS = (
+    'skill agent workflow database schema query index cache request response '
+    'handler worker deploy config token session route component template style '
+    'bundle stream buffer parser validator package archive manifest reference '
+    'postgres durable object queue binding migration rollback snapshot replica'
+).split()
+
+
+def _scaled(n, scale):
+    return max(1, int(n * scale))
+
+
+def _text(rng, size):
+    """Markdown-ish filler text of roughly `size` bytes."""
+    parts, total, section = [], 0, 0
+    while total < size:
+        section += 1
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(40, 120)))
+        chunk = f"## Section {section}\n\n{words}.\n\n"
+        if section % 7 == 0:
+            chunk += f"```python\ndef step_{section}(x):\n    return x * {section}\n```\n\n"
+        parts.append(chunk)
+        total += len(chunk)
+    return ''.join(parts)
+
+
+def _write_skill(skill_dir, body, description=None, close_frontmatter=True):
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    name = skill_dir.name
+    description = description or f"Synthetic benchmark skill {name}. Use when measuring the tooling."
+    fence = '---\n' if close_frontmatter else ''
+    (skill_dir / 'SKILL.md').write_text(
+        f"---\nname: {name}\ndescription: {description}\n{fence}\n# {name}\n\n{body}",
+        encoding='utf-8',
+    )
+
+
+# =====================================================
+# WORKLOAD INPUTS
+# =====================================================
+
+def gen_large_skill_md(root, scale, close_frontmatter=True):
+    rng = random.Random(1)
+    # Generate a varied block once and repeat it; validate cost is in size, not variety
+    block = _text(rng, 256 * 1024)
+    repeats = _scaled(32, scale)
+    _write_skill(root / 'large-skill', block * repeats, close_frontmatter=close_frontmatter)
+    return len(block) * repeats
+
+
+def gen_unterminated_skill_md(root, scale):
+    return gen_large_skill_md(root, scale, close_frontmatter=False)
+
+
+def gen_10k_file_tree(root, scale):
+    rng = random.Random(2)
+    skill_dir = root / 'huge-skill'
+    _write_skill(skill_dir, _text(rng, 4096))
+    pool = _text(rng, 64 * 1024)
+    files = _scaled(10_000, scale)
+    suffixes = ('.md', '.md', '.py', '.json', '.txt')
+    for i in range(files - 1):
+        directory = skill_dir / ('references', 'scripts', 'assets')[i % 3] / f"group-{i % 100:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        start = rng.randrange(len(pool) - 4096)
+        (directory / f"file-{i:05d}{suffixes[i % len(suffixes)]}").write_text(
+            pool[start:start + rng.randint(200, 4096)], encoding='utf-8'
+        )
+    return files
+
+
+def gen_1000_skills(root, scale):
+    rng = random.Random(3)
+    pool = _text(rng, 64 * 1024)
+    skills = _scaled(1000, scale)
+    for i in range(skills):
+        skill_dir = root / 'skills' / f"synthetic-skill-{i:04d}"
+        start = rng.randrange(len(pool) - 8192)
+        _write_skill(skill_dir, pool[start:start + rng.randint(1024, 8192)])
+        (skill_dir / 'references').mkdir()
+        (skill_dir / 'references' / 'notes.md').write_text(pool[:2048], encoding='utf-8')
+    return skills
+
+
+def gen_huge_vue(root, scale):
+    """An SFC with a multi-megabyte script block full of near-miss closing tags."""
+    rng = random.Random(4)
+    lines = ["<script setup>", "import { ref, computed } from 'vue'"]
+    for i in range(_scaled(60_000, scale)):
+        word = rng.choice(WORDS)
+        kind = i % 5
+        if kind == 0:
+            lines.append(f"const {word}{i} = ref('<scrip' + 't setup> {word}')")
+        elif kind == 1:
+            lines.append(f"const {word}Html{i} = `<div>${{{word}{i - 1}.value}}</scrip` + 't-ish</div>`")
+        elif kind == 2:
+            lines.append(f"// </ script> is not a closing tag: {word} {i}")
+        elif kind == 3:
+            lines.append(f"const {word}Total{i} = computed(() => {word}{i - 3}.value.length * {i})")
+        else:
+            lines.append(f"function on{word.capitalize()}{i}(event) {{ return event.target.value < {i} }}")
+    lines.append("</script>")
+    template = '\n'.join(
+        f'  <div v-if="show{i}" class="row-{i}"><span>{{{{ item{i} }}}}</span></div>'
+        for i in range(_scaled(20_000, scale))
+    )
+    content = '\n'.join(lines) + f"\n\n<template>\n<div>\n{template}\n</div>\n</template>\n"
+    path = root / 'Huge.vue'
+    path.write_text(content, encoding='utf-8')
+    return len(content.encode('utf-8'))
+
+
+def gen_unclosed_vue(root, scale):
+    """Many <script setup> openers and no closing tag: every opener rescans the rest."""
+    rng = random.Random(5)
+    filler = _text(rng, 4096)
+    content = ''.join(f"<script setup>\n// block {i}\n{filler}" for i in range(_scaled(300, scale)))
+    path = root / 'Unclosed.vue'
+    path.write_text(content, encoding='utf-8')
+    return len(content.encode('utf-8'))
+
+
+# =====================================================
+# WORKLOAD RUNNERS (executed in the child process)
+# =====================================================
+
+def run_validate_one(data_dir):
+    from quick_validate import validate_skill
+
+    valid, message = validate_skill(data_dir / 'large-skill')
+    if not valid:
+        raise RuntimeError(message)
+
+
+def run_validate_unterminated(data_dir):
+    from quick_validate import validate_skill
+
+    valid, _ = validate_skill(data_dir / 'large-skill')
+    if valid:
+        raise RuntimeError("Unterminated frontmatter was accepted")
+
+
+def run_validate_many(data_dir):
+    from quick_validate import validate_skill
+
+    for skill_dir in sorted((data_dir / 'skills').iterdir()):
+        valid, message = validate_skill(skill_dir)
+        if not valid:
+            raise RuntimeError(f"{skill_dir.name}: {message}")
+
+
+def run_package(data_dir):
+    from package_skill import package_skill
+
+    if not package_skill(data_dir / 'huge-skill', data_dir / 'out'):
+        raise RuntimeError("package_skill failed")
+
+
+def run_init_many(data_dir, count):
+    from init_skill import init_skill
+
+    for i in range(count):
+        if not init_skill(f"bench-skill-{i:04d}", data_dir / 'out'):
+            raise RuntimeError("init_skill failed")
+
+
+def run_extract(data_dir, name, expect_match):
+    from sfc import extract_script_setup
+
+    found = extract_script_setup((data_dir / name).read_text(encoding='utf-8')) is not None
+    if found != expect_match:
+        raise RuntimeError(f"Unexpected extraction result for {name}")
+
+
+# name -> (input generator, runner, throughput unit)
+# Generators return how many units the workload processes; runners take the
+# input directory and that count.
+WORKLOADS = {
+    'validate-large-skill-md': (gen_large_skill_md, lambda d, n: run_validate_one(d), 'bytes'),
+    'validate-unterminated-frontmatter': (gen_unterminated_skill_md,
+                                          lambda d, n: run_validate_unterminated(d), 'bytes'),
+    'validate-1000-skills': (gen_1000_skills, lambda d, n: run_validate_many(d), 'skills'),
+    'package-10k-files': (gen_10k_file_tree, lambda d, n: run_package(d), 'files'),
+    'init-1000-skills': (lambda root, scale: _scaled(1000, scale), run_init_many, 'skills'),
+    'sfc-extract-huge-script': (gen_huge_vue,
+                                lambda d, n: run_extract(d, 'Huge.vue', True), 'bytes'),
+    'sfc-extract-unclosed-script': (gen_unclosed_vue,
+                                    lambda d, n: run_extract(d, 'Unclosed.vue', False), 'bytes'),
+}
+
+
+def _peak_rss_kb():
+    # VmHWM is per process image; ru_maxrss on Linux carries over the peak of
+    # the parent that spawned us, which here is the driver holding the inputs
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def child(name, data_dir, units):
+    """Run one workload once and print its measurements as JSON."""
+    import contextlib
+    import io
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    data_dir = Path(data_dir)
+    shutil.rmtree(data_dir / 'out', ignore_errors=True)
+    _, runner, _ = WORKLOADS[name]
+
+    # The tools report progress on stdout; keep it out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        runner(data_dir, units)
+        wall_ms = (time.perf_counter() - start) * 1000
+    shutil.rmtree(data_dir / 'out', ignore_errors=True)
+    print(json.dumps({'wall_ms': wall_ms, 'peak_rss_kb': _peak_rss_kb()}))
+
+
+# =====================================================
+# DRIVER
+# =====================================================
+
+def prepare(name, workdir, scale):
+    """Generate (or reuse) a workload's input. Returns (input directory, units)."""
+    data_dir = workdir / f"{name}@{scale:g}"
+    marker = data_dir / '.generated.json'
+    if marker.exists():
+        return data_dir, json.loads(marker.read_text())['units']
+
+    shutil.rmtree(data_dir, ignore_errors=True)
+    data_dir.mkdir(parents=True)
+    generate, _, _ = WORKLOADS[name]
+    units = generate(data_dir, scale)
+    marker.write_text(json.dumps({'units': units}))
+    return data_dir, units
+
+
+def measure(name, data_dir, units, runs):
+    """Run a workload `runs` times in fresh processes and return summary stats."""
+    wall_ms, rss_kb = [], []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, str(Path(__file__).resolve()), '--child', name, str(data_dir), str(units)],
+            capture_output=True, text=True, cwd=SCRIPTS_DIR,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip()
+                               else f"exit code {result.returncode}")
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        wall_ms.append(sample['wall_ms'])
+        if sample['peak_rss_kb'] is not None:
+            rss_kb.append(sample['peak_rss_kb'])
+
+    unit = WORKLOADS[name][2]
+    median_ms = statistics.median(wall_ms)
+    per_second = units / (median_ms / 1000) if median_ms else 0.0
+    return {
+        'wall_ms': round(median_ms, 2),
+        'peak_rss_kb': max(rss_kb) if rss_kb else None,
+        'units': units,
+        'unit': unit,
+        'throughput': round(per_second / (1024 * 1024) if unit == 'bytes' else per_second, 2),
+        'throughput_unit': 'MB/s' if unit == 'bytes' else f"{unit}/s",
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results to a baseline taken at the same scale.
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        before, after = previous['wall_ms'], current['wall_ms']
+        if after - before > max(before * threshold, MIN_REGRESSION_MS):
+            regressions.append(f"{name}: wall {before:.1f} -> {after:.1f} ms")
+        before, after = previous.get('peak_rss_kb'), current.get('peak_rss_kb')
+        if before and after and after - before > max(before * threshold, MIN_REGRESSION_RSS_KB):
+            regressions.append(f"{name}: peak RSS {before / 1024:.1f} -> {after / 1024:.1f} MB")
+    return regressions
+
+
+def run_bench(runs=3, scale=1.0, only=None, workdir=None, save_path=None,
+              baseline_path=None, threshold=0.2):
+    """
+    Benchmark the selected workloads.
+
+    Returns:
+        Process exit code: 1 if a workload failed or regressed against the baseline
+    """
+    names = only or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        print(f"❌ Unknown workload(s): {', '.join(unknown)}")
+        print(f"   Available: {', '.join(WORKLOADS)}")
+        return 1
+
+    keep_inputs = workdir is not None
+    workdir = Path(workdir) if keep_inputs else Path(tempfile.mkdtemp(prefix='bench-tools-'))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    print(f"⏱️  Benchmarking tooling workloads (scale {scale:g}, {runs} runs each)\n")
+    print(f"  {'workload':<34} {'wall':>10} {'peak RSS':>10} {'throughput':>16}")
+
+    results, failed = {}, []
+    try:
+        for name in names:
+            data_dir, units = prepare(name, workdir, scale)
+            try:
+                r = measure(name, data_dir, units, runs)
+            except RuntimeError as e:
+                failed.append(name)
+                print(f"  {name:<34} ❌ {e}")
+                continue
+            results[name] = r
+            rss = f"{r['peak_rss_kb'] / 1024:.1f}MB" if r['peak_rss_kb'] else 'n/a'
+            throughput = f"{r['throughput']:,.1f} {r['throughput_unit']}"
+            print(f"  {name:<34} {r['wall_ms']:>8.1f}ms {rss:>10} {throughput:>16}")
+    finally:
+        if not keep_inputs:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if save_path:
+        payload = {'python': sys.version.split()[0], 'scale': scale, 'runs': runs, 'workloads': results}
+        Path(save_path).write_text(json.dumps(payload, indent=2) + '\n')
+        print(f"\n✅ Results saved to: {save_path}")
+
+    if failed:
+        print(f"\n❌ {len(failed)} workload(s) failed: {', '.join(failed)}")
+        return 1
+
+    if baseline_path:
+        baseline = json.loads(Path(baseline_path).read_text())
+        if baseline.get('scale') != scale:
+            print(f"\n❌ Baseline {baseline_path} was taken at scale {baseline.get('scale')}, not {scale:g}")
+            return 1
+        regressions = compare(results, baseline.get('workloads', {}), threshold)
+        if regressions:
+            print(f"\n❌ Regressions vs {baseline_path} (threshold {threshold:.0%}):")
+            for message in regressions:
+                print(f"   {message}")
+            return 1
+        print(f"\n✅ No regressions vs {baseline_path}")
+
+    return 0
+
+
+def main():
+    if len(sys.argv) == 5 and sys.argv[1] == '--child':
+        child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+        return
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the Python tooling on synthetic workloads")
+    parser.add_argument('--runs', type=int, default=3, help="Fresh processes per workload (default: 3)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiply every workload's size (default: 1.0)")
+    parser.add_argument('--only', nargs='+', metavar='WORKLOAD', help="Run only these workloads")
+    parser.add_argument('--workdir', help="Keep generated inputs here and reuse them across runs")
+    parser.add_argument('--save', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Allowed slowdown / RSS growth as a fraction (default: 0.2)")
+    args = parser.parse_args()
+    sys.exit(run_bench(args.runs, args.scale, args.only, args.workdir,
+                       args.save, args.baseline, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ Examples:
 
 import sys
 from pathlib import Path
+from timings import span, setup
 
 
 SKILL_TEMPLATE = """---
@@ -220,14 +221,16 @@ def init_skill(skill_name, path):
 
     # Create SKILL.md from template
     skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
-        skill_name=skill_name,
-        skill_title=skill_title
-    )
+    with span('template render'):
+        skill_content = SKILL_TEMPLATE.format(
+            skill_name=skill_name,
+            skill_title=skill_title
+        )
 
     skill_md_path = skill_dir / 'SKILL.md'
     try:
-        skill_md_path.write_text(skill_content)
+        with span('file write', path='SKILL.md'):
+            skill_md_path.write_text(skill_content)
         print("✅ Created SKILL.md")
     except Exception as e:
         print(f"❌ Error creating SKILL.md: {e}")
@@ -235,27 +238,28 @@ def init_skill(skill_name, path):
 
     # Create resource directories with example files
     try:
-        # Create scripts/ directory with example script
-        scripts_dir = skill_dir / 'scripts'
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / 'example.py'
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-        example_script.chmod(0o755)
-        print("✅ Created scripts/example.py")
-
-        # Create references/ directory with example reference doc
-        references_dir = skill_dir / 'references'
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / 'api_reference.md'
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-        print("✅ Created references/api_reference.md")
-
-        # Create assets/ directory with example asset placeholder
-        assets_dir = skill_dir / 'assets'
-        assets_dir.mkdir(exist_ok=True)
-        example_asset = assets_dir / 'example_asset.txt'
-        example_asset.write_text(EXAMPLE_ASSET)
-        print("✅ Created assets/example_asset.txt")
+        with span('file write', path='resources'):
+            # Create scripts/ directory with example script
+            scripts_dir = skill_dir / 'scripts'
+            scripts_dir.mkdir(exist_ok=True)
+            example_script = scripts_dir / 'example.py'
+            example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
+            example_script.chmod(0o755)
+            print("✅ Created scripts/example.py")
+
+            # Create references/ directory with example reference doc
+            references_dir = skill_dir / 'references'
+            references_dir.mkdir(exist_ok=True)
+            example_reference = references_dir / 'api_reference.md'
+            example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
+            print("✅ Created references/api_reference.md")
+
+            # Create assets/ directory with example asset placeholder
+            assets_dir = skill_dir / 'assets'
+            assets_dir.mkdir(exist_ok=True)
+            example_asset = assets_dir / 'example_asset.txt'
+            example_asset.write_text(EXAMPLE_ASSET)
+            print("✅ Created assets/example_asset.txt")
     except Exception as e:
         print(f"❌ Error creating resource directories: {e}")
         return None
@@ -271,8 +275,9 @@ def init_skill(skill_name, path):
 
 
 def main():
-    if len(sys.argv) < 4 or sys.argv[2] != '--path':
-        print("Usage: init_skill.py <skill-name> --path <path>")
+    argv = setup('init_skill', sys.argv)
+    if len(argv) < 4 or argv[2] != '--path':
+        print("Usage: init_skill.py <skill-name> --path <path> [--timings <path>] [--profile <path>]")
         print("\nSkill name requirements:")
         print("  - Kebab-case identifier (e.g., 'my-data-analyzer')")
         print("  - Lowercase letters, digits, and hyphens only")
@@ -284,8 +289,8 @@ def main():
         print("  init_skill.py custom-skill --path /custom/location")
         sys.exit(1)
 
-    skill_name = sys.argv[1]
-    path = sys.argv[3]
+    skill_name = argv[1]
+    path = argv[3]
 
     print(f"🚀 Initializing skill: {skill_name}")
     print(f"   Location: {path}")
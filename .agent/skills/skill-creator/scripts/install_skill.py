@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Skill Installer - Installs .skill archives into a skills directory
+
+The counterpart to package_skill.py. Archives are installed concurrently, and
+each one is:
+
+- verified: every entry is checked against the sha256 recorded in the archive
+  manifest at package time
+- swapped in whole: files are written to a temp directory beside the target,
+  then the current install is renamed aside and the new one renamed into
+  place, so a skill is never seen half-installed (though it is briefly absent
+  between the two renames)
+- incremental: a skill whose files are already byte-identical on disk (with
+  the same permissions) is skipped, and unchanged files are hard-linked from
+  the current install instead of being decompressed again
+- exclusive: installs of the same skill are serialized across threads and,
+  through a lock file in the skills directory, across processes
+
+File permissions recorded in the archive (e.g. the exec bit on scripts) are
+restored. If a run is interrupted mid-swap, the next run of the same skill
+renames the previous install back into place before cleaning up, so a rollout
+can simply be re-run until it succeeds.
+
+Usage:
+    install_skill.py <skills-directory> <archive.skill> [<archive.skill> ...] [-j N] [--no-verify]
+
+Examples:
+    install_skill.py ~/.agent/skills dist/*.skill
+    install_skill.py /srv/agent/skills dist/neon-postgres.skill -j 8
+"""
+
+import hashlib
+import os
+import stat
+import shutil
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from skill_archive import SkillArchive
+from timings import span, setup
+
+
+TMP_MARKER = '.tmp-'
+OLD_MARKER = '.old-'
+LOCK_SUFFIX = '.lock'
+
+
+# Two archives for the same skill must not be swapped in at the same time
+_skill_locks = {}
+_skill_locks_guard = threading.Lock()
+
+
+class InstallError(Exception):
+    pass
+
+
+def _skill_lock(skill_name):
+    with _skill_locks_guard:
+        return _skill_locks.setdefault(skill_name, threading.Lock())
+
+
+class _ProcessLock:
+    """
+    Exclusive lock on dest_dir/.<skill>.lock, held across cleanup and swap.
+
+    Another installer process must not clean up this one's temp directory or
+    swap the skill underneath it. The lock file is left in place: removing it
+    would let a waiting process lock a file nobody else can see.
+    """
+
+    def __init__(self, dest_dir, skill_name):
+        self.path = dest_dir / f".{skill_name}{LOCK_SUFFIX}"
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a+b')
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        # Closing the file releases the lock
+        self._file.close()
+        return False
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _skill_name(names):
+    """All entries of a .skill archive live under a single top-level folder."""
+    roots = {name.split('/', 1)[0] for name in names}
+    if len(roots) != 1 or any('/' not in name for name in names):
+        raise InstallError(f"Expected a single top-level skill folder, found: {', '.join(sorted(roots))}")
+    name = roots.pop()
+    if name in ('', '.', '..') or name.startswith('.'):
+        raise InstallError(f"Invalid skill folder name: {name!r}")
+    return name
+
+
+def _cleanup_stale(dest_dir, skill_name):
+    """
+    Recover from an interrupted install, then remove its temp/old directories.
+
+    A run killed between the two renames of the swap leaves no target, only the
+    previous install under its .old- name; that install is put back first.
+    """
+    target = dest_dir / skill_name
+    old_dirs = list(dest_dir.glob(f".{skill_name}{OLD_MARKER}*"))
+    if old_dirs and not target.exists():
+        # Renaming a directory updates its ctime, so the newest one was renamed aside last
+        os.rename(max(old_dirs, key=lambda p: p.stat().st_ctime), target)
+
+    for pattern in (f".{skill_name}{TMP_MARKER}*", f".{skill_name}{OLD_MARKER}*"):
+        for stale in dest_dir.glob(pattern):
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def _installed_matches(target, archive, names):
+    """
+    Compare the current install against the archive manifest.
+
+    Returns:
+        Set of relative paths (within the skill folder) whose on-disk bytes
+        already match, and whether the install matches exactly
+    """
+    identical = set()
+    if not target.is_dir():
+        return identical, False
+
+    for name in names:
+        relative = name.split('/', 1)[1]
+        existing = target / relative
+        expected = archive.expected_sha256(name)
+        if not (expected and existing.is_file()):
+            continue
+        existing_stat = existing.stat()
+        mode = archive.mode(name)
+        if (existing_stat.st_size == archive.info(name)[0]
+                and (mode is None or stat.S_IMODE(existing_stat.st_mode) == mode)
+                and _sha256(existing) == expected):
+            identical.add(relative)
+
+    on_disk = {
+        p.relative_to(target).as_posix()
+        for p in target.rglob('*') if p.is_file()
+    }
+    return identical, identical == on_disk and len(identical) == len(names)
+
+
+def install_skill(archive_path, dest_dir, verify=True):
+    """
+    Install one .skill archive into dest_dir.
+
+    Args:
+        archive_path: Path to the .skill file
+        dest_dir: Skills directory; the skill lands in dest_dir/<skill-name>
+        verify: Require and check the manifest's per-entry sha256
+
+    Returns:
+        Tuple of (skill name, status) where status is 'installed', 'updated'
+        or 'unchanged'
+    """
+    dest_dir = Path(dest_dir).resolve()
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    with SkillArchive(archive_path) as archive:
+        names = archive.names()
+        skill_name = _skill_name(names)
+        if verify and not all(archive.expected_sha256(n) for n in names):
+            raise InstallError("Archive has no per-entry hashes (repackage it, or pass --no-verify)")
+
+        with _skill_lock(skill_name), _ProcessLock(dest_dir, skill_name):
+            return skill_name, _install_locked(archive, names, dest_dir, skill_name, verify)
+
+
+def _install_locked(archive, names, dest_dir, skill_name, verify):
+    target = dest_dir / skill_name
+    _cleanup_stale(dest_dir, skill_name)
+
+    with span('compare', skill=skill_name):
+        identical, unchanged = _installed_matches(target, archive, names)
+    if unchanged:
+        return 'unchanged'
+
+    existed = target.exists()
+    tmp_dir = dest_dir / f".{skill_name}{TMP_MARKER}{uuid.uuid4().hex[:8]}"
+    try:
+        with span('extract', skill=skill_name, files=len(names), reused=len(identical)):
+            for name in names:
+                relative = name.split('/', 1)[1]
+                out_path = (tmp_dir / relative).resolve()
+                if tmp_dir.resolve() not in out_path.parents:
+                    raise InstallError(f"Refusing to extract outside the skill folder: {name}")
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+
+                if relative in identical:
+                    try:
+                        os.link(target / relative, out_path)
+                    except OSError:
+                        shutil.copy2(target / relative, out_path)
+                    continue
+
+                data = archive.read(name)
+                expected = archive.expected_sha256(name)
+                if verify and hashlib.sha256(data).hexdigest() != expected:
+                    raise InstallError(f"Hash mismatch for {name}")
+                out_path.write_bytes(data)
+                mode = archive.mode(name)
+                if mode:
+                    out_path.chmod(mode)
+
+        with span('swap', skill=skill_name):
+            if existed:
+                old_dir = dest_dir / f".{skill_name}{OLD_MARKER}{uuid.uuid4().hex[:8]}"
+                os.rename(target, old_dir)
+                try:
+                    os.rename(tmp_dir, target)
+                except OSError:
+                    os.rename(old_dir, target)
+                    raise
+                shutil.rmtree(old_dir, ignore_errors=True)
+            else:
+                os.rename(tmp_dir, target)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return 'updated' if existed else 'installed'
+
+
+def install_skills(archive_paths, dest_dir, workers=None, verify=True):
+    """
+    Install several archives concurrently.
+
+    Returns:
+        List of (archive path, skill name or None, status or error message, ok)
+    """
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    def run(archive_path):
+        try:
+            skill_name, status = install_skill(archive_path, dest_dir, verify)
+            return archive_path, skill_name, status, True
+        except Exception as e:
+            return archive_path, None, str(e), False
+
+    workers = workers or min(8, (os.cpu_count() or 1) + 4, len(archive_paths)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, archive_paths))
+
+
+def run_install(dest_dir, archives, workers=None, verify=True):
+    """Install archives and print a per-skill report. Returns a process exit code."""
+    print(f"📥 Installing {len(archives)} skill archive(s) into: {dest_dir}")
+    print()
+
+    results = install_skills(archives, dest_dir, workers, verify)
+    failed = 0
+    for archive_path, skill_name, status, ok in results:
+        if ok:
+            icon = '⏭️ ' if status == 'unchanged' else '✅'
+            print(f"  {icon} {skill_name}: {status}")
+        else:
+            failed += 1
+            print(f"  ❌ {archive_path}: {status}")
+
+    print()
+    if failed:
+        print(f"❌ {failed} of {len(results)} archive(s) failed to install")
+        return 1
+    print(f"✅ Installed {len(results)} skill archive(s)")
+    return 0
+
+
+def main():
+    argv = setup('install_skill', sys.argv)
+    verify = '--no-verify' not in argv
+    if not verify:
+        argv.remove('--no-verify')
+    workers = None
+    if '-j' in argv:
+        i = argv.index('-j')
+        try:
+            workers = int(argv[i + 1])
+        except (IndexError, ValueError):
+            print("❌ Error: -j requires a number")
+            sys.exit(1)
+        del argv[i:i + 2]
+
+    if len(argv) < 3:
+        print("Usage: install_skill.py <skills-directory> <archive.skill> [<archive.skill> ...] [-j N] [--no-verify]")
+        print("\nExample:")
+        print("  install_skill.py ~/.agent/skills dist/*.skill")
+        sys.exit(1)
+
+    sys.exit(run_install(argv[1], argv[2:], workers, verify))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,30 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--zstd]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --zstd
+
+--zstd compresses entries with the trained skill dictionary (see skill_archive.py).
 """
 
 import sys
-import zipfile
 from pathlib import Path
-from quick_validate import validate_skill
+from timings import span, setup
 
 
-def package_skill(skill_path, output_dir=None):
+def package_skill(skill_path, output_dir=None, compression='deflate', dictionary_version=None):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        compression: 'deflate' (plain zip) or 'zstd-dict' (Zstandard with the skill dictionary)
+        dictionary_version: zstd dictionary version to use (defaults to the latest)
 
     Returns:
         Path to the created .skill file, or None if error
@@ -44,9 +48,12 @@ def package_skill(skill_path, output_dir=None):
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
-    # Run validation before packaging
+    # Run validation before packaging (imported here so --help doesn't pay for yaml)
+    from quick_validate import validate_skill
+
     print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
+    with span('validate'):
+        valid, message = validate_skill(skill_path)
     if not valid:
         print(f"❌ Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
@@ -64,14 +71,19 @@ def package_skill(skill_path, output_dir=None):
     skill_filename = output_path / f"{skill_name}.skill"
 
     # Create the .skill file (zip format)
+    from skill_archive import SkillArchiveWriter
+
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
+        # Walk through the skill directory
+        with span('tree walk'):
+            files = [p for p in skill_path.rglob('*') if p.is_file()]
+
+        with span('compress', files=len(files), compression=compression):
+            with SkillArchiveWriter(skill_filename, compression, dictionary_version) as writer:
+                for file_path in files:
                     # Calculate the relative path within the zip
                     arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
+                    writer.add(file_path, arcname)
                     print(f"  Added: {arcname}")
 
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
@@ -83,22 +95,28 @@ def package_skill(skill_path, output_dir=None):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
+    argv = setup('package_skill', sys.argv)
+    compression = 'deflate'
+    if '--zstd' in argv:
+        argv.remove('--zstd')
+        compression = 'zstd-dict'
+    if len(argv) < 2:
+        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory] [--zstd] [--timings <path>] [--profile <path>]")
         print("\nExample:")
         print("  python utils/package_skill.py skills/public/my-skill")
         print("  python utils/package_skill.py skills/public/my-skill ./dist")
+        print("  python utils/package_skill.py skills/public/my-skill ./dist --zstd")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    skill_path = argv[1]
+    output_dir = argv[2] if len(argv) > 2 else None
 
     print(f"📦 Packaging skill: {skill_path}")
     if output_dir:
         print(f"   Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, compression)
 
     if result:
         sys.exit(0)
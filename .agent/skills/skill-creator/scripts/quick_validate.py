@@ -8,35 +8,52 @@ import os
 import re
 import yaml
 from pathlib import Path
+from timings import span, setup
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
-    skill_path = Path(skill_path)
+def parse_frontmatter(content):
+    """
+    Extract and parse the YAML frontmatter of a SKILL.md.
 
-    # Check SKILL.md exists
-    skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
-
-    # Read and validate frontmatter
-    content = skill_md.read_text()
+    Returns:
+        Tuple of (frontmatter dict, None) or (None, error message)
+    """
     if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
+        return None, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    with span('regex extract'):
+        match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
     if not match:
-        return False, "Invalid frontmatter format"
+        return None, "Invalid frontmatter format"
 
     frontmatter_text = match.group(1)
 
     # Parse YAML frontmatter
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        with span('frontmatter parse'):
+            frontmatter = yaml.safe_load(frontmatter_text)
         if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
+            return None, "Frontmatter must be a YAML dictionary"
     except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        return None, f"Invalid YAML in frontmatter: {e}"
+
+    return frontmatter, None
+
+def validate_skill(skill_path):
+    """Basic validation of a skill"""
+    skill_path = Path(skill_path)
+
+    # Check SKILL.md exists
+    skill_md = skill_path / 'SKILL.md'
+    if not skill_md.exists():
+        return False, "SKILL.md not found"
+
+    # Read and validate frontmatter
+    with span('read SKILL.md'):
+        content = skill_md.read_text()
+    frontmatter, error = parse_frontmatter(content)
+    if error:
+        return False, error
 
     # Define allowed properties
     ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata', 'compatibility'}
@@ -94,10 +111,12 @@ def validate_skill(skill_path):
     return True, "Skill is valid!"
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
+    argv = setup('quick_validate', sys.argv)
+    if len(argv) != 2:
+        print("Usage: python quick_validate.py <skill_directory> [--timings <path>] [--profile <path>]")
         sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
+
+    with span('validate'):
+        valid, message = validate_skill(argv[1])
     print(message)
     sys.exit(0 if valid else 1)
\ No newline at end of file
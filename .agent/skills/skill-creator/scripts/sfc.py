@@ -0,0 +1,33 @@
+"""
+Vue single-file component blocks
+
+Regex-level access to the <script> and <template> blocks of a .vue file, shared
+by build_admin_dashboard.py and analyze_vue_splits.py. This is not a parser:
+like Vue's own SFC splitter, it treats the first </script> after an opening tag
+as the end of the block.
+"""
+
+import re
+
+
+# The <script setup> block of a single-file component, tags included
+SCRIPT_SETUP_RE = re.compile(r'(<script setup>.*?</script>)', re.DOTALL)
+SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.DOTALL)
+TEMPLATE_RE = re.compile(r'<template>(.*)</template>', re.DOTALL)
+
+
+def extract_script_setup(content):
+    """Return the <script setup>...</script> block of an SFC, or None."""
+    match = SCRIPT_SETUP_RE.search(content)
+    return match.group(1) if match else None
+
+
+def script_blocks(content):
+    """Contents of every <script> block, joined in file order."""
+    return '\n'.join(SCRIPT_RE.findall(content))
+
+
+def template_block(content):
+    """Contents of the outermost <template> block, or None."""
+    match = TEMPLATE_RE.search(content)
+    return match.group(1) if match else None
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Skill archive formats - Zstandard dictionary compression and a matching reader
+
+A .skill file is a zip archive. By default every entry is DEFLATE-compressed on
+its own, which does poorly on the many small markdown files skills are made of.
+In zstd mode each entry is compressed with Zstandard using a dictionary trained
+on the repo's skill corpus, then stored uncompressed in the zip under its name
+plus a .zst suffix, so tools that don't know the format extract visibly
+compressed files rather than silently writing zstd frames under the real names.
+
+Every archive carries a manifest at its root listing each entry's size and
+sha256 (checked by install_skill.py) and, in zstd mode, the dictionary version
+and hash, so readers can find the right dictionary and refuse a mismatched one.
+
+Dictionaries live in dictionaries/skills-v<N>.zdict next to this script and are
+never modified once published; retraining writes the next version.
+
+Requires the optional `zstandard` package for zstd mode (pip install zstandard).
+Plain DEFLATE archives need only the standard library.
+
+Usage:
+    skill_archive.py train [--corpus <dir> ...]
+    skill_archive.py extract <archive.skill> <output-directory>
+
+Examples:
+    skill_archive.py train
+    skill_archive.py extract dist/neon-postgres.skill ./unpacked
+"""
+
+import hashlib
+import json
+import re
+import sys
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DICTIONARY_DIR = SCRIPTS_DIR / 'dictionaries'
+REPO_ROOT = SCRIPTS_DIR.parents[3]
+DEFAULT_CORPUS = [
+    REPO_ROOT / '.agent' / 'skills',
+    REPO_ROOT / 'backend' / '.agents' / 'skills',
+]
+
+MANIFEST_NAME = '.skill-manifest.json'
+MANIFEST_FORMAT = 1
+COMPRESSION_DEFLATE = 'deflate'
+COMPRESSION_ZSTD = 'zstd-dict'
+ZSTD_SUFFIX = '.zst'
+
+DICTIONARY_RE = re.compile(r'^skills-v(\d+)\.zdict$')
+TRAINING_SUFFIXES = {'.md', '.txt', '.py', '.js', '.ts', '.json', '.yaml', '.yml'}
+DEFAULT_DICT_SIZE = 112 * 1024
+ZSTD_LEVEL = 19
+
+
+def _zstd():
+    """Import zstandard, with a helpful error when the optional dependency is missing."""
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(
+            "zstd mode requires the 'zstandard' package (pip install zstandard)"
+        ) from None
+    return zstandard
+
+
+# =====================================================
+# DICTIONARIES
+# =====================================================
+
+def dictionary_versions(directory=DICTIONARY_DIR):
+    """Return the available dictionary versions, oldest first."""
+    if not directory.is_dir():
+        return []
+    return sorted(
+        int(match.group(1))
+        for match in (DICTIONARY_RE.match(p.name) for p in directory.iterdir())
+        if match
+    )
+
+
+def dictionary_path(version, directory=DICTIONARY_DIR):
+    return directory / f"skills-v{version}.zdict"
+
+
+def load_dictionary(version=None, directory=DICTIONARY_DIR):
+    """
+    Load a trained dictionary.
+
+    Args:
+        version: Dictionary version (defaults to the latest)
+        directory: Where dictionaries are stored
+
+    Returns:
+        Tuple of (version, raw dictionary bytes)
+    """
+    if version is None:
+        versions = dictionary_versions(directory)
+        if not versions:
+            raise RuntimeError(
+                f"No zstd dictionary found in {directory}. Train one with: skill_archive.py train"
+            )
+        version = versions[-1]
+    path = dictionary_path(version, directory)
+    if not path.exists():
+        raise RuntimeError(f"zstd dictionary v{version} not found: {path}")
+    return version, path.read_bytes()
+
+
+def train_dictionary(corpus_roots=None, dict_size=DEFAULT_DICT_SIZE, directory=DICTIONARY_DIR):
+    """
+    Train a new dictionary version on the skill corpus.
+
+    Args:
+        corpus_roots: Directories to sample text files from (defaults to the repo's skills)
+        dict_size: Target dictionary size in bytes
+        directory: Where to write the dictionary
+
+    Returns:
+        Tuple of (path to the new dictionary, number of samples)
+    """
+    zstd = _zstd()
+    samples = []
+    for root in corpus_roots or DEFAULT_CORPUS:
+        for path in sorted(Path(root).rglob('*')):
+            if path.is_file() and path.suffix in TRAINING_SUFFIXES:
+                samples.append(path.read_bytes())
+    if not samples:
+        raise RuntimeError("No training samples found in the corpus")
+
+    trained = zstd.train_dictionary(dict_size, samples, level=ZSTD_LEVEL)
+    versions = dictionary_versions(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = dictionary_path(versions[-1] + 1 if versions else 1, directory)
+    path.write_bytes(trained.as_bytes())
+    return path, len(samples)
+
+
+def dictionary_info(version, data):
+    """Manifest entry identifying a dictionary."""
+    return {
+        'version': version,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'size': len(data),
+    }
+
+
+# =====================================================
+# WRITING
+# =====================================================
+
+class SkillArchiveWriter:
+    """
+    Writes .skill archives in either DEFLATE or zstd-dictionary mode.
+
+    Usage:
+        with SkillArchiveWriter(path, compression='zstd-dict') as writer:
+            writer.add(file_path, arcname)
+    """
+
+    def __init__(self, path, compression=COMPRESSION_DEFLATE, dictionary_version=None):
+        if compression not in (COMPRESSION_DEFLATE, COMPRESSION_ZSTD):
+            raise ValueError(f"Unknown compression: {compression}")
+        self.compression = compression
+        self.entries = {}
+        self.dictionary = None
+        self._compressor = None
+
+        if compression == COMPRESSION_ZSTD:
+            zstd = _zstd()
+            version, data = load_dictionary(dictionary_version)
+            self.dictionary = dictionary_info(version, data)
+            self._compressor = zstd.ZstdCompressor(
+                level=ZSTD_LEVEL,
+                dict_data=zstd.ZstdCompressionDict(data),
+                write_content_size=True,
+            )
+            self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED)
+        else:
+            self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+
+    def add(self, file_path, arcname):
+        arcname = Path(arcname).as_posix()
+        data = Path(file_path).read_bytes()
+        info = zipfile.ZipInfo.from_file(file_path, arcname)
+        if self._compressor is None:
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+        else:
+            info.filename += ZSTD_SUFFIX
+            info.compress_type = zipfile.ZIP_STORED
+            self._zip.writestr(info, self._compressor.compress(data))
+        self.entries[arcname] = {'size': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+
+    def close(self):
+        manifest = {
+            'format': MANIFEST_FORMAT,
+            'compression': self.compression,
+            'entries': self.entries,
+        }
+        if self.dictionary:
+            manifest['dictionary'] = self.dictionary
+        self._zip.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True))
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# =====================================================
+# READING
+# =====================================================
+
+@lru_cache(maxsize=None)
+def _dictionary(version, sha256):
+    """
+    Load and verify (once per process) the dictionary an archive was built with.
+
+    Loading and digesting the dictionary costs more than decompressing a
+    typical skill, so it is shared by every archive opened in the process.
+    Decompressors are not thread-safe and are built per archive instead.
+    """
+    version, data = load_dictionary(version)
+    if hashlib.sha256(data).hexdigest() != sha256:
+        raise RuntimeError(
+            f"zstd dictionary v{version} does not match the one this archive was built with"
+        )
+    return _zstd().ZstdCompressionDict(data)
+
+
+class SkillArchive:
+    """
+    Reads .skill archives written in either mode.
+
+    Members are addressed by their original names; in zstd mode the .zst suffix
+    of the stored members is hidden.
+
+    Usage:
+        with SkillArchive(path) as archive:
+            for name in archive.names():
+                data = archive.read(name)
+    """
+
+    def __init__(self, path):
+        self._zip = zipfile.ZipFile(path)
+        try:
+            self._open()
+        except BaseException:
+            self._zip.close()
+            raise
+
+    def _open(self):
+        self.manifest = {}
+        self._decompressor = None
+        try:
+            self.manifest = json.loads(self._zip.read(MANIFEST_NAME))
+        except KeyError:
+            pass
+        except ValueError as e:
+            raise RuntimeError(f"corrupt manifest: {e}") from None
+        if not isinstance(self.manifest, dict):
+            raise RuntimeError("corrupt manifest: expected a JSON object")
+
+        self.compression = self.manifest.get('compression', COMPRESSION_DEFLATE)
+        if self.compression == COMPRESSION_ZSTD:
+            try:
+                version = self.manifest['dictionary']['version']
+                sha256 = self.manifest['dictionary']['sha256']
+            except (KeyError, TypeError):
+                raise RuntimeError("corrupt manifest: zstd archive without a dictionary entry") from None
+        elif self.compression != COMPRESSION_DEFLATE:
+            raise RuntimeError(f"Unsupported archive compression: {self.compression}")
+
+        self._members = {}
+        for info in self._zip.infolist():
+            if info.is_dir() or info.filename == MANIFEST_NAME:
+                continue
+            name = info.filename
+            if self.compression == COMPRESSION_ZSTD:
+                if not name.endswith(ZSTD_SUFFIX):
+                    raise RuntimeError(f"corrupt archive: {name} is not a zstd member")
+                name = name[:-len(ZSTD_SUFFIX)]
+            self._members[name] = info
+
+        if self.compression == COMPRESSION_ZSTD:
+            self._decompressor = _zstd().ZstdDecompressor(dict_data=_dictionary(version, sha256))
+
+    def names(self):
+        """Original member names, excluding directories and the manifest."""
+        return list(self._members)
+
+    def _getinfo(self, name):
+        try:
+            return self._members[name]
+        except KeyError:
+            raise KeyError(f"There is no item named {name!r} in the archive") from None
+
+    def expected_sha256(self, name):
+        """sha256 recorded for a member at package time, or None for archives without one."""
+        return self.manifest.get('entries', {}).get(name, {}).get('sha256')
+
+    def info(self, name):
+        """Return (original size, stored size) for a member."""
+        zinfo = self._getinfo(name)
+        if self._decompressor is not None:
+            try:
+                return self.manifest['entries'][name]['size'], zinfo.file_size
+            except (KeyError, TypeError):
+                raise RuntimeError(f"corrupt manifest: no size recorded for {name}") from None
+        return zinfo.file_size, zinfo.compress_size
+
+    def mode(self, name):
+        """Unix permission bits recorded for a member, or None if the archive has none."""
+        mode = (self._getinfo(name).external_attr >> 16) & 0o777
+        return mode or None
+
+    def read(self, name):
+        data = self._zip.read(self._getinfo(name))
+        if self._decompressor is not None:
+            data = self._decompressor.decompress(data)
+        return data
+
+    def extract_all(self, output_dir):
+        """Extract every member under output_dir and return the written paths."""
+        output_dir = Path(output_dir).resolve()
+        written = []
+        for name in self.names():
+            target = (output_dir / name).resolve()
+            if output_dir not in target.parents:
+                raise RuntimeError(f"Refusing to extract outside the output directory: {name}")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(self.read(name))
+            mode = self.mode(name)
+            if mode:
+                target.chmod(mode)
+            written.append(target)
+        return written
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == 'train':
+        corpus = sys.argv[2:]
+        if corpus and corpus[0] == '--corpus':
+            corpus = corpus[1:]
+        try:
+            path, samples = train_dictionary(corpus or None)
+        except RuntimeError as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"✅ Trained dictionary on {samples} files: {path}")
+        sys.exit(0)
+
+    if len(sys.argv) == 4 and sys.argv[1] == 'extract':
+        try:
+            with SkillArchive(sys.argv[2]) as archive:
+                written = archive.extract_all(sys.argv[3])
+        except (OSError, RuntimeError, zipfile.BadZipFile) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"✅ Extracted {len(written)} files to: {sys.argv[3]}")
+        sys.exit(0)
+
+    print("Usage:")
+    print("  skill_archive.py train [--corpus <dir> ...]")
+    print("  skill_archive.py extract <archive.skill> <output-directory>")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Skill Index - Ranked full-text search over the skill library
+
+Builds a persistent BM25 index from each skill's frontmatter (name and
+description), SKILL.md headings and body, and its reference files, so picking a
+skill doesn't mean reading every SKILL.md in turn. The index is refreshed
+incrementally: files whose size and mtime are unchanged keep their stored term
+counts, so a refresh with nothing to do is a stat() walk.
+
+Usage:
+    skill_index.py build [--index <path>] [<skills-root> ...]
+    skill_index.py search <query> [-k N] [--index <path>] [--no-refresh]
+
+Examples:
+    skill_index.py build
+    skill_index.py search "postgres connection pooling"
+    skill_index.py search "durable object alarms" -k 3
+"""
+
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parents[3]
+DEFAULT_ROOTS = [
+    REPO_ROOT / '.agent' / 'skills',
+    REPO_ROOT / 'backend' / '.agents' / 'skills',
+]
+DEFAULT_INDEX = REPO_ROOT / '.skill-index.json'
+INDEX_FORMAT = 1
+
+# Reference files that are indexed alongside SKILL.md
+REFERENCE_SUFFIXES = {'.md', '.txt'}
+
+# Term-frequency weights per field: a match in the description says far more
+# about what a skill is for than a match deep in a reference file
+FIELD_WEIGHTS = {
+    'name': 4,
+    'description': 3,
+    'heading': 2,
+    'body': 1,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+HEADING_RE = re.compile(r'^#{1,6}\s+(.*)$')
+STOPWORDS = frozenset(
+    'a an and are as at be by can for from has have how if in into is it its of on or '
+    'that the their then there these this to use used uses using was when which will '
+    'with you your'.split()
+)
+
+
+def tokenize(text):
+    """Lowercase word tokens with stopwords and single characters removed."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def _count(counts, text, weight):
+    for token in tokenize(text):
+        counts[token] = counts.get(token, 0) + weight
+
+
+def _split_markdown(text):
+    """Split markdown into (headings, body) text, ignoring fenced code blocks for headings."""
+    headings, body = [], []
+    in_fence = False
+    for line in text.splitlines():
+        if line.lstrip().startswith('```'):
+            in_fence = not in_fence
+            body.append(line)
+            continue
+        match = None if in_fence else HEADING_RE.match(line)
+        if match:
+            headings.append(match.group(1))
+        else:
+            body.append(line)
+    return '\n'.join(headings), '\n'.join(body)
+
+
+def analyze_skill_md(content):
+    """
+    Term counts and metadata for a SKILL.md.
+
+    Returns:
+        Tuple of (term counts dict, name, description)
+    """
+    from quick_validate import parse_frontmatter
+
+    frontmatter, _ = parse_frontmatter(content)
+    frontmatter = frontmatter or {}
+    name = str(frontmatter.get('name', ''))
+    description = ' '.join(str(frontmatter.get('description', '')).split())
+
+    # Body is everything after the closing frontmatter fence
+    body = content.split('\n---', 1)[1] if content.startswith('---') and '\n---' in content else content
+    headings, body = _split_markdown(body)
+
+    counts = {}
+    _count(counts, name.replace('-', ' '), FIELD_WEIGHTS['name'])
+    _count(counts, description, FIELD_WEIGHTS['description'])
+    _count(counts, headings, FIELD_WEIGHTS['heading'])
+    _count(counts, body, FIELD_WEIGHTS['body'])
+    return counts, name, description
+
+
+def analyze_reference(content):
+    headings, body = _split_markdown(content)
+    counts = {}
+    _count(counts, headings, FIELD_WEIGHTS['heading'])
+    _count(counts, body, FIELD_WEIGHTS['body'])
+    return counts
+
+
+def _fingerprint(path):
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _skill_files(skill_dir):
+    """SKILL.md followed by the skill's reference files."""
+    files = [skill_dir / 'SKILL.md']
+    references = skill_dir / 'references'
+    if references.is_dir():
+        files += sorted(
+            p for p in references.rglob('*')
+            if p.is_file() and p.suffix in REFERENCE_SUFFIXES
+        )
+    return files
+
+
+class _TermsUnavailable(Exception):
+    """The per-file term counts sidecar could not be read."""
+
+
+class SkillIndex:
+    """
+    Persistent BM25 index over skill directories.
+
+    The index file holds what queries need (postings, document lengths, skill
+    metadata) plus file fingerprints. Per-file term counts, needed only when
+    something changed, live in a sidecar <index>.terms.json that is loaded on
+    demand, so querying never parses them.
+    """
+
+    def __init__(self, path=None, roots=None):
+        self.path = Path(path or DEFAULT_INDEX)
+        self.terms_path = self.path.with_suffix('.terms.json')
+        self.roots = [Path(r).resolve() for r in roots] if roots else None
+        self.files = {}       # file path -> {'fingerprint', 'skill'}
+        self.skills = {}      # skill dir -> {'name', 'description'}
+        self.docs = []        # skill dirs, in posting order
+        self.postings = {}    # term -> [[doc number, weighted tf], ...]
+        self.lengths = []     # document length per doc number
+        self._terms = None    # file path -> term counts (lazy)
+        saved_roots = self.load()
+        # Without explicit roots, keep indexing whatever the index was built from
+        if self.roots is None:
+            self.roots = [Path(r).resolve() for r in (saved_roots or DEFAULT_ROOTS)]
+
+    def load(self):
+        """Load the index file. Returns the skill roots it was built from, if any."""
+        if not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if data.get('format') != INDEX_FORMAT:
+            return None
+        self.files = data['files']
+        self.skills = data['skills']
+        self.docs = data['docs']
+        self.postings = data['postings']
+        self.lengths = data['lengths']
+        return data.get('roots')
+
+    def _load_terms(self):
+        if self._terms is None:
+            try:
+                self._terms = json.loads(self.terms_path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                raise _TermsUnavailable from None
+        return self._terms
+
+    def _write_json(self, path, data):
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+        tmp.replace(path)
+
+    def save(self):
+        # Terms first: an index must never reference term counts that weren't written
+        self._write_json(self.terms_path, self._load_terms())
+        self._write_json(self.path, {
+            'format': INDEX_FORMAT,
+            'roots': [str(r) for r in self.roots],
+            'files': self.files,
+            'skills': self.skills,
+            'docs': self.docs,
+            'postings': self.postings,
+            'lengths': self.lengths,
+        })
+
+    def refresh(self):
+        """
+        Bring the index up to date with the skill roots.
+
+        Returns:
+            Dict with counts of 'reindexed' and 'removed' files
+        """
+        try:
+            return self._refresh()
+        except _TermsUnavailable:
+            # The sidecar is missing or corrupt. Files already skipped as
+            # unchanged have no term counts to rebuild from, so every file is
+            # re-read. The sidecar is loaded before anything is modified, so
+            # the aborted pass left no partial state behind.
+            self._terms = {}
+            self.files = {}
+            return self._refresh()
+
+    def _refresh(self):
+        seen = set()
+        reindexed = 0
+        changed = False
+
+        for root in self.roots:
+            if not root.is_dir():
+                continue
+            for skill_md in sorted(root.glob('*/SKILL.md')):
+                skill_dir = str(skill_md.parent)
+                for file_path in _skill_files(skill_md.parent):
+                    key = str(file_path)
+                    seen.add(key)
+                    fingerprint = _fingerprint(file_path)
+                    entry = self.files.get(key)
+                    if entry and entry['fingerprint'] == fingerprint:
+                        continue
+
+                    terms_by_file = self._load_terms()
+                    content = file_path.read_text(encoding='utf-8', errors='replace')
+                    if file_path == skill_md:
+                        terms, name, description = analyze_skill_md(content)
+                        self.skills[skill_dir] = {'name': name or skill_md.parent.name,
+                                                  'description': description}
+                    else:
+                        terms = analyze_reference(content)
+                    self.files[key] = {'fingerprint': fingerprint, 'skill': skill_dir}
+                    terms_by_file[key] = terms
+                    changed = True
+                    reindexed += 1
+
+        removed = [key for key in self.files if key not in seen]
+        if removed:
+            terms_by_file = self._load_terms()
+            for key in removed:
+                del self.files[key]
+                terms_by_file.pop(key, None)
+            changed = True
+
+        if changed:
+            live_skills = {entry['skill'] for entry in self.files.values()}
+            for skill_dir in list(self.skills):
+                if skill_dir not in live_skills:
+                    del self.skills[skill_dir]
+            self._rebuild_postings()
+            self.save()
+        return {'reindexed': reindexed, 'removed': len(removed)}
+
+    def _rebuild_postings(self):
+        terms_by_file = self._load_terms()
+        totals = {}
+        for key, entry in self.files.items():
+            skill_terms = totals.setdefault(entry['skill'], {})
+            for term, count in terms_by_file[key].items():
+                skill_terms[term] = skill_terms.get(term, 0) + count
+
+        self.docs = sorted(totals)
+        self.postings = {}
+        self.lengths = []
+        for doc, skill_dir in enumerate(self.docs):
+            terms = totals[skill_dir]
+            self.lengths.append(sum(terms.values()))
+            for term, count in terms.items():
+                self.postings.setdefault(term, []).append([doc, count])
+
+    def search(self, query, limit=5):
+        """
+        Rank skills against a free-text query.
+
+        Returns:
+            List of dicts (score, name, description, path), best first
+        """
+        if not self.lengths:
+            return []
+        n_docs = len(self.lengths)
+        avg_length = sum(self.lengths) / n_docs
+        scores = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc, tf in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc] / avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        results = []
+        for doc, score in ranked:
+            skill_dir = self.docs[doc]
+            meta = self.skills.get(skill_dir, {})
+            results.append({
+                'score': round(score, 3),
+                'name': meta.get('name', Path(skill_dir).name),
+                'description': meta.get('description', ''),
+                'path': skill_dir,
+            })
+        return results
+
+
+def print_results(results):
+    if not results:
+        print("No matching skills")
+        return
+    for rank, result in enumerate(results, start=1):
+        description = result['description']
+        if len(description) > 100:
+            description = description[:97] + '...'
+        print(f"{rank}. {result['name']} ({result['score']})")
+        print(f"   {description}")
+        print(f"   {result['path']}")
+
+
+def _pop_option(argv, flag, default=None):
+    if flag in argv:
+        i = argv.index(flag)
+        if i + 1 >= len(argv):
+            print(f"❌ Error: {flag} requires a value")
+            sys.exit(1)
+        value = argv[i + 1]
+        del argv[i:i + 2]
+        return value
+    return default
+
+
+def main():
+    argv = sys.argv[1:]
+    index_path = _pop_option(argv, '--index', DEFAULT_INDEX)
+
+    if argv and argv[0] == 'build':
+        index = SkillIndex(index_path, argv[1:] or None)
+        stats = index.refresh()
+        print(f"✅ Indexed {len(index.skills)} skills "
+              f"({stats['reindexed']} files updated, {stats['removed']} removed): {index.path}")
+        sys.exit(0)
+
+    if argv and argv[0] == 'search' and len(argv) >= 2:
+        try:
+            limit = int(_pop_option(argv, '-k', 5))
+        except ValueError:
+            print("❌ Error: -k requires a number")
+            sys.exit(1)
+        refresh = '--no-refresh' not in argv
+        if not refresh:
+            argv.remove('--no-refresh')
+        index = SkillIndex(index_path)
+        if refresh:
+            index.refresh()
+        print_results(index.search(' '.join(argv[1:]), limit))
+        sys.exit(0)
+
+    print("Usage:")
+    print("  skill_index.py build [--index <path>] [<skills-root> ...]")
+    print("  skill_index.py search <query> [-k N] [--index <path>] [--no-refresh]")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+skilltool - Single entry point for the skill tooling
+
+Each subcommand imports what it needs only when it runs, so `skilltool --help`
+and cheap commands don't pay for yaml, zipfile and friends.
+
+Usage:
+    skilltool.py init <skill-name> --path <path>
+    skilltool.py validate <path/to/skill-folder>
+    skilltool.py package <path/to/skill-folder> [output-directory] [--zstd [--dictionary N]]
+    skilltool.py inspect <path/to/skill-folder-or-.skill>
+    skilltool.py install <skills-directory> <archive.skill> [...] [-j N] [--no-verify]
+    skilltool.py train-dict [--corpus <dir> ...]
+    skilltool.py index [<skills-root> ...]
+    skilltool.py search <query> [-k N]
+    skilltool.py bench [--runs N] [--save baseline.json] [--baseline baseline.json]
+    skilltool.py bench-tools [--runs N] [--scale X] [--only <workload> ...] [--save ...] [--baseline ...]
+
+All subcommands accept --timings <path> and --profile <path> (see timings.py).
+
+Examples:
+    skilltool.py validate skills/public/my-skill
+    skilltool.py package skills/public/my-skill ./dist
+    skilltool.py bench --runs 20 --baseline bench-baseline.json
+    skilltool.py bench-tools --scale 0.1 --only package-10k-files
+"""
+
+import sys
+
+from timings import setup
+
+
+def cmd_init(args):
+    from init_skill import init_skill
+
+    print(f"🚀 Initializing skill: {args.skill_name}")
+    print(f"   Location: {args.path}")
+    print()
+    return 0 if init_skill(args.skill_name, args.path) else 1
+
+
+def cmd_validate(args):
+    from quick_validate import validate_skill
+
+    valid, message = validate_skill(args.skill_path)
+    print(message)
+    return 0 if valid else 1
+
+
+def cmd_package(args):
+    from package_skill import package_skill
+
+    print(f"📦 Packaging skill: {args.skill_path}")
+    if args.output_dir:
+        print(f"   Output directory: {args.output_dir}")
+    print()
+    compression = 'zstd-dict' if args.zstd else 'deflate'
+    result = package_skill(args.skill_path, args.output_dir, compression, args.dictionary)
+    return 0 if result else 1
+
+
+def cmd_inspect(args):
+    from pathlib import Path
+    from quick_validate import parse_frontmatter
+
+    target = Path(args.target)
+    if target.is_dir():
+        skill_md = target / 'SKILL.md'
+        if not skill_md.exists():
+            print(f"❌ Error: SKILL.md not found in {target}")
+            return 1
+        content = skill_md.read_text()
+        entries = [
+            (str(p.relative_to(target.parent)), p.stat().st_size, None)
+            for p in sorted(target.rglob('*')) if p.is_file()
+        ]
+    elif target.is_file():
+        import zipfile
+        from skill_archive import SkillArchive
+
+        try:
+            with SkillArchive(target) as archive:
+                names = archive.names()
+                skill_md = next((n for n in names if n.endswith('/SKILL.md') and n.count('/') == 1), None)
+                if skill_md is None:
+                    print(f"❌ Error: SKILL.md not found in {target}")
+                    return 1
+                content = archive.read(skill_md).decode('utf-8')
+                entries = [(name, *archive.info(name)) for name in names]
+                if archive.compression != 'deflate':
+                    dictionary = archive.manifest['dictionary']
+                    print(f"🗜️  {archive.compression}, dictionary v{dictionary['version']}")
+        except (zipfile.BadZipFile, RuntimeError) as e:
+            print(f"❌ Error: Cannot read .skill archive: {e}")
+            return 1
+    else:
+        print(f"❌ Error: Not found: {target}")
+        return 1
+
+    frontmatter, error = parse_frontmatter(content)
+    if error:
+        print(f"❌ {error}")
+        return 1
+
+    print(f"🔍 {frontmatter.get('name', '?')}")
+    description = ' '.join(str(frontmatter.get('description', '')).split())
+    print(f"   {description}")
+    print()
+    total = stored = 0
+    for name, size, compressed in entries:
+        total += size
+        stored += compressed if compressed is not None else size
+        suffix = f" -> {compressed:>8,} B" if compressed is not None else ''
+        print(f"  {size:>8,} B{suffix}  {name}")
+    print(f"\n  {len(entries)} files, {total:,} bytes", end='')
+    print(f", {stored:,} bytes stored ({stored / total:.0%})" if total and stored != total else '')
+    return 0
+
+
+def cmd_install(args):
+    from install_skill import run_install
+
+    return run_install(args.dest_dir, args.archives, args.jobs, not args.no_verify)
+
+
+def cmd_train_dict(args):
+    from skill_archive import train_dictionary
+
+    try:
+        path, samples = train_dictionary(args.corpus)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    print(f"✅ Trained dictionary on {samples} files: {path}")
+    return 0
+
+
+def cmd_index(args):
+    from skill_index import SkillIndex
+
+    index = SkillIndex(args.index, args.roots or None)
+    stats = index.refresh()
+    print(f"✅ Indexed {len(index.skills)} skills "
+          f"({stats['reindexed']} files updated, {stats['removed']} removed): {index.path}")
+    return 0
+
+
+def cmd_search(args):
+    from skill_index import SkillIndex, print_results
+
+    index = SkillIndex(args.index)
+    if not args.no_refresh:
+        index.refresh()
+    print_results(index.search(' '.join(args.query), args.k))
+    return 0
+
+
+def cmd_bench(args):
+    from bench_startup import run_bench
+
+    return run_bench(
+        runs=args.runs,
+        save_path=args.save,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+    )
+
+
+def cmd_bench_tools(args):
+    from bench_tools import run_bench
+
+    return run_bench(
+        runs=args.runs,
+        scale=args.scale,
+        only=args.only,
+        workdir=args.workdir,
+        save_path=args.save,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+    )
+
+
+def build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='skilltool',
+        description="Create, validate, package and inspect skills",
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>')
+    subparsers.required = True
+
+    init = subparsers.add_parser('init', help="Create a new skill from the template")
+    init.add_argument('skill_name', help="Kebab-case skill name")
+    init.add_argument('--path', required=True, help="Directory to create the skill in")
+    init.set_defaults(func=cmd_init)
+
+    validate = subparsers.add_parser('validate', help="Validate a skill folder")
+    validate.add_argument('skill_path', help="Path to the skill folder")
+    validate.set_defaults(func=cmd_validate)
+
+    package = subparsers.add_parser('package', help="Package a skill folder into a .skill file")
+    package.add_argument('skill_path', help="Path to the skill folder")
+    package.add_argument('output_dir', nargs='?', help="Output directory (default: current directory)")
+    package.add_argument('--zstd', action='store_true',
+                         help="Compress with Zstandard and the trained skill dictionary")
+    package.add_argument('--dictionary', type=int, help="zstd dictionary version (default: latest)")
+    package.set_defaults(func=cmd_package)
+
+    inspect = subparsers.add_parser('inspect', help="Show a skill's frontmatter and files")
+    inspect.add_argument('target', help="Skill folder or .skill archive")
+    inspect.set_defaults(func=cmd_inspect)
+
+    install = subparsers.add_parser('install', help="Verify and install .skill archives")
+    install.add_argument('dest_dir', help="Skills directory to install into")
+    install.add_argument('archives', nargs='+', help=".skill archives to install")
+    install.add_argument('-j', '--jobs', type=int, help="Parallel installs (default: up to 8)")
+    install.add_argument('--no-verify', action='store_true',
+                         help="Allow archives without per-entry hashes")
+    install.set_defaults(func=cmd_install)
+
+    train = subparsers.add_parser('train-dict', help="Train a new zstd dictionary on the skill corpus")
+    train.add_argument('--corpus', nargs='+', help="Directories to sample (default: the repo's skills)")
+    train.set_defaults(func=cmd_train_dict)
+
+    index = subparsers.add_parser('index', help="Build or refresh the skill search index")
+    index.add_argument('roots', nargs='*', help="Skill roots to index (default: the repo's skills)")
+    index.add_argument('--index', default=None, help="Index file (default: <repo>/.skill-index.json)")
+    index.set_defaults(func=cmd_index)
+
+    search = subparsers.add_parser('search', help="Find the skills that best match a query")
+    search.add_argument('query', nargs='+', help="Free-text query")
+    search.add_argument('-k', type=int, default=5, help="Number of results (default: 5)")
+    search.add_argument('--index', default=None, help="Index file (default: <repo>/.skill-index.json)")
+    search.add_argument('--no-refresh', action='store_true', help="Query the index as-is")
+    search.set_defaults(func=cmd_search)
+
+    bench = subparsers.add_parser('bench', help="Benchmark cold-start time of skilltool commands")
+    bench.add_argument('--runs', type=int, default=10, help="Fresh processes per command (default: 10)")
+    bench.add_argument('--save', help="Write results to this JSON file (e.g. a new baseline)")
+    bench.add_argument('--baseline', help="Compare against a saved baseline and fail on regressions")
+    bench.add_argument('--threshold', type=float, default=0.2,
+                       help="Allowed slowdown vs baseline as a fraction (default: 0.2)")
+    bench.set_defaults(func=cmd_bench)
+
+    bench_tools = subparsers.add_parser('bench-tools',
+                                        help="Benchmark the tooling on large synthetic workloads")
+    bench_tools.add_argument('--runs', type=int, default=3, help="Fresh processes per workload (default: 3)")
+    bench_tools.add_argument('--scale', type=float, default=1.0,
+                             help="Multiply every workload's size (default: 1.0)")
+    bench_tools.add_argument('--only', nargs='+', metavar='WORKLOAD', help="Run only these workloads")
+    bench_tools.add_argument('--workdir', help="Keep generated inputs here and reuse them across runs")
+    bench_tools.add_argument('--save', help="Write results to this JSON file (e.g. a new baseline)")
+    bench_tools.add_argument('--baseline', help="Compare against a saved baseline and fail on regressions")
+    bench_tools.add_argument('--threshold', type=float, default=0.2,
+                             help="Allowed slowdown / RSS growth as a fraction (default: 0.2)")
+    bench_tools.set_defaults(func=cmd_bench_tools)
+
+    return parser
+
+
+def main(argv=None):
+    argv = setup('skilltool', sys.argv if argv is None else argv)
+    args = build_parser().parse_args(argv[1:])
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Timing instrumentation shared by the skill tooling scripts
+
+Scripts wrap their phases in span() and call setup() on their argv. Spans cost
+next to nothing unless one of the flags below is passed:
+
+    --timings <path>            Write recorded spans to <path>
+    --timings-format json|chrome
+                                json (default): spans plus a per-phase summary
+                                chrome: Chrome trace events, open in
+                                chrome://tracing or https://ui.perfetto.dev
+    --profile <path>            Also capture a cProfile dump (view with snakeviz
+                                or `python -m pstats <path>`)
+
+Example:
+    python package_skill.py skills/my-skill --timings timings.json
+    python quick_validate.py skills/my-skill --timings trace.json --timings-format chrome
+"""
+
+import atexit
+import os
+import sys
+import time
+
+
+# Kept import-light on purpose: every tool imports this at startup, and
+# skilltool's bench command tracks how long that takes.
+_recorder = None
+
+
+class _NullSpan:
+    """Context manager used when timings are disabled."""
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        local = self.recorder._local
+        self.depth = getattr(local, 'depth', 0)
+        local.depth = self.depth + 1
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.recorder._local.depth = self.depth
+        self.recorder.spans.append({
+            'name': self.name,
+            'start_us': (self.start - self.recorder.origin) / 1000,
+            'duration_us': (end - self.start) / 1000,
+            'depth': self.depth,
+            'tid': self.recorder._get_ident(),
+            'args': self.args,
+        })
+        return False
+
+
+class Recorder:
+    """Collects completed spans for one process."""
+
+    def __init__(self, tool):
+        import threading
+
+        self.tool = tool
+        self.origin = time.perf_counter_ns()
+        self.spans = []
+        self._local = threading.local()
+        self._get_ident = threading.get_ident
+
+    def span(self, name, args):
+        return _Span(self, name, args)
+
+    def to_json(self):
+        summary = {}
+        for span in self.spans:
+            entry = summary.setdefault(span['name'], {'count': 0, 'total_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += span['duration_us'] / 1000
+        return {
+            'tool': self.tool,
+            'total_ms': (time.perf_counter_ns() - self.origin) / 1e6,
+            'summary': summary,
+            'spans': sorted(self.spans, key=lambda s: s['start_us']),
+        }
+
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        events = [{
+            'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+            'args': {'name': self.tool},
+        }]
+        for span in self.spans:
+            events.append({
+                'name': span['name'],
+                'cat': self.tool,
+                'ph': 'X',
+                'ts': span['start_us'],
+                'dur': span['duration_us'],
+                'pid': pid,
+                'tid': span['tid'],
+                'args': span['args'],
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def span(name, **args):
+    """
+    Time a phase of work.
+
+    Usage:
+        with span('compress', files=len(files)):
+            ...
+
+    Returns a no-op context manager when timings are disabled.
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _recorder.span(name, args)
+
+
+def _pop_flag(argv, flag):
+    """Remove `flag value` (or `flag=value`) from argv and return the value."""
+    for i, arg in enumerate(argv):
+        if arg == flag:
+            if i + 1 >= len(argv):
+                raise SystemExit(f"❌ Error: {flag} requires a value")
+            value = argv[i + 1]
+            del argv[i:i + 2]
+            return value
+        if arg.startswith(flag + '='):
+            del argv[i]
+            return arg.split('=', 1)[1]
+    return None
+
+
+def setup(tool, argv):
+    """
+    Strip the timing flags from argv and start recording if any were given.
+
+    Args:
+        tool: Name recorded in the output (usually the script name)
+        argv: Argument list, typically sys.argv
+
+    Returns:
+        argv without the timing flags
+    """
+    global _recorder
+
+    argv = list(argv)
+    timings_path = _pop_flag(argv, '--timings')
+    timings_format = _pop_flag(argv, '--timings-format') or 'json'
+    profile_path = _pop_flag(argv, '--profile')
+
+    if timings_format not in ('json', 'chrome'):
+        raise SystemExit(f"❌ Error: --timings-format must be 'json' or 'chrome', got '{timings_format}'")
+
+    if timings_path:
+        _recorder = Recorder(tool)
+
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if timings_path or profiler:
+        atexit.register(_finish, timings_path, timings_format, profiler, profile_path)
+
+    return argv
+
+
+def _finish(timings_path, timings_format, profiler, profile_path):
+    """Write the recorded output; registered with atexit so sys.exit() paths are covered."""
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+        print(f"⏱️  Profile written to: {profile_path}", file=sys.stderr)
+
+    if timings_path:
+        import json
+        from pathlib import Path
+
+        data = _recorder.to_chrome_trace() if timings_format == 'chrome' else _recorder.to_json()
+        path = Path(timings_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2, default=str))
+        print(f"⏱️  Timings written to: {timings_path}", file=sys.stderr)
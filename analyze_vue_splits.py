@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Vue code-splitting advisor - Import graph and split points for the frontend
+
+Builds the module graph of frontend/src (views, components, composables and the
+main.js/App.vue entry) from the static and dynamic imports in each module's
+script, weighs every module by its source size and estimated gzip size, and
+groups modules into the chunks a bundler would load together: the entry chunk
+plus one chunk per dynamic import().
+
+From that it recommends:
+
+- route-level splits: route components imported statically by main.js
+- async components: child components rendered only inside v-if / v-else-if /
+  v-else branches, ranked by how much of their parent's chunk they would move
+  out (their exclusive import closure)
+- gate-then-split candidates: heavy components that are always mounted and
+  hide themselves with their own v-if, which only pay off once the parent
+  gates them too
+
+Weights are source bytes, not bundled output, so treat them as relative sizes.
+A v-if can't tell a rarely-opened tab from a loading state that flips on every
+visit, so --apply rewrites only the components it is given by name.
+
+Usage:
+    python analyze_vue_splits.py [--json] [--min-kb N] [--apply Component ...]
+
+Examples:
+    python analyze_vue_splits.py
+    python analyze_vue_splits.py --json > splits.json
+    python analyze_vue_splits.py --apply ProductsManager OrdersManager
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+# Shared timing instrumentation and SFC helpers live with the skill tooling scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent / '.agent' / 'skills' / 'skill-creator' / 'scripts'))
+from sfc import extract_script_setup, script_blocks, template_block  # noqa: E402
+from timings import span, setup  # noqa: E402
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+FRONTEND = REPO_ROOT / 'frontend'
+SRC = FRONTEND / 'src'
+ENTRY = SRC / 'main.js'
+SCAN_DIRS = ('views', 'components', 'composables')
+
+RESOLVE_SUFFIXES = ('', '.js', '.ts', '.vue', '/index.js', '/index.ts')
+
+# Splits that move out less than this (estimated gzip KB) aren't worth a request
+DEFAULT_MIN_KB = 2.0
+
+STATIC_IMPORT_RE = re.compile(
+    r'^[ \t]*import\s+(?:([\w$]+)\s*,?\s*)?(?:\{[^}]*\}\s*|\*\s*as\s+[\w$]+\s*)?(?:from\s*)?'
+    r'([\'"])([^\'"]+)\2[ \t]*;?[ \t]*\n?',
+    re.MULTILINE,
+)
+DYNAMIC_IMPORT_RE = re.compile(r'\bimport\(\s*[\'"]([^\'"]+)[\'"]\s*\)')
+VUE_IMPORT_RE = re.compile(r'import\s*\{([^}]*)\}\s*from\s*[\'"]vue[\'"]')
+ROUTE_COMPONENT_RE = re.compile(r'\bcomponent\s*:\s*([A-Z][\w$]*)')
+
+COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+TAG_RE = re.compile(
+    r'<(/?)([A-Za-z][\w.:-]*)'
+    r'((?:\s+[^\s=/>]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+))?)*)'
+    r'\s*(/?)>'
+)
+CONDITION_RE = re.compile(r'(?:^|\s)(v-if|v-else-if|v-else)(?=[\s=]|$)')
+VOID_ELEMENTS = frozenset(
+    'area base br col embed hr img input link meta param source track wbr'.split()
+)
+
+
+# =====================================================
+# MODULE GRAPH
+# =====================================================
+
+def script_source(path, content):
+    """Script text of a module: the <script> blocks of an SFC, or the whole file."""
+    if path.suffix != '.vue':
+        return content
+    return script_blocks(content)
+
+
+def resolve_import(specifier, importer):
+    """
+    Resolve an import specifier the way Vite does for this project.
+
+    Returns:
+        Absolute Path for local modules, or None for packages
+    """
+    if specifier.startswith('@/'):
+        base = SRC / specifier[2:]
+    elif specifier.startswith('.'):
+        base = importer.parent / specifier
+    else:
+        return None
+    for suffix in RESOLVE_SUFFIXES:
+        candidate = Path(str(base) + suffix)
+        if candidate.is_file():
+            return candidate.resolve()
+    return Path(str(base)).resolve()
+
+
+def parse_imports(path, content):
+    """
+    Imports of one module.
+
+    Returns:
+        List of dicts (specifier, local default name or None, dynamic)
+    """
+    source = script_source(path, content)
+    imports = [
+        {'specifier': m.group(3), 'name': m.group(1), 'dynamic': False}
+        for m in STATIC_IMPORT_RE.finditer(source)
+    ]
+    imports += [
+        {'specifier': specifier, 'name': None, 'dynamic': True}
+        for specifier in DYNAMIC_IMPORT_RE.findall(source)
+    ]
+    return imports
+
+
+def _rel(path):
+    try:
+        return path.relative_to(SRC).as_posix()
+    except ValueError:
+        return path.relative_to(FRONTEND).as_posix() if FRONTEND in path.parents else str(path)
+
+
+def build_graph(src=SRC):
+    """
+    Walk the frontend from its entry and scan directories.
+
+    Returns:
+        Dict of module id -> {'path', 'bytes', 'gzip', 'imports', 'packages'}
+        where imports are dicts (target id, name, dynamic)
+    """
+    pending = [ENTRY, src / 'App.vue']
+    for directory in SCAN_DIRS:
+        pending += sorted(p for p in (src / directory).rglob('*') if p.suffix in ('.vue', '.js'))
+
+    graph = {}
+    while pending:
+        path = pending.pop().resolve()
+        module_id = _rel(path)
+        if module_id in graph:
+            continue
+        if not path.is_file():
+            graph[module_id] = {'path': path, 'bytes': 0, 'gzip': 0, 'imports': [],
+                                'packages': [], 'missing': True}
+            continue
+
+        raw = path.read_bytes()
+        node = {
+            'path': path,
+            'bytes': len(raw),
+            'gzip': len(gzip.compress(raw, compresslevel=9)),
+            'imports': [],
+            'packages': [],
+        }
+        graph[module_id] = node
+        if path.suffix not in ('.vue', '.js', '.ts'):
+            continue
+
+        for imp in parse_imports(path, raw.decode('utf-8', errors='replace')):
+            target = resolve_import(imp['specifier'], path)
+            if target is None:
+                node['packages'].append(imp['specifier'])
+                continue
+            node['imports'].append({'target': _rel(target), 'name': imp['name'],
+                                    'dynamic': imp['dynamic'], 'specifier': imp['specifier']})
+            pending.append(target)
+    return graph
+
+
+def static_closure(graph, root, skip_edge=None):
+    """Modules loaded with root: everything reachable through static imports."""
+    seen = {root}
+    stack = [root]
+    while stack:
+        module_id = stack.pop()
+        for imp in graph[module_id]['imports']:
+            target = imp['target']
+            if imp['dynamic'] or target in seen or (module_id, target) == skip_edge:
+                continue
+            seen.add(target)
+            stack.append(target)
+    return seen
+
+
+def chunks(graph):
+    """
+    The entry chunk plus one chunk per dynamic import target.
+
+    Returns:
+        Dict of chunk root id -> set of module ids it adds to what is loaded
+    """
+    roots = [_rel(ENTRY.resolve())]
+    for node in graph.values():
+        roots += [imp['target'] for imp in node['imports']
+                  if imp['dynamic'] and imp['target'] not in roots]
+    loaded = {roots[0]: static_closure(graph, roots[0])}
+    # Modules the entry chunk already loaded cost a dynamic chunk nothing
+    for root in roots[1:]:
+        loaded[root] = static_closure(graph, root) - loaded[roots[0]]
+    return loaded
+
+
+def weigh(graph, modules):
+    return (sum(graph[m]['bytes'] for m in modules),
+            sum(graph[m]['gzip'] for m in modules))
+
+
+# =====================================================
+# TEMPLATE USAGE
+# =====================================================
+
+def _kebab(name):
+    return re.sub(r'(?<!^)(?=[A-Z])', '-', name).lower()
+
+
+def component_usages(content):
+    """
+    How each component tag is rendered in an SFC template.
+
+    Each usage is classified by its innermost conditional element (itself or
+    an ancestor): 'branch' for a v-if/v-else-if/v-else chain, where only one
+    side renders at a time, 'if' for a lone v-if, 'always' otherwise.
+
+    Returns:
+        Dict of tag name -> list of usage kinds
+    """
+    template = template_block(content)
+    if template is None:
+        return {}
+    template = COMMENT_RE.sub('', template)
+
+    # Stack frames: [tag, own conditional record or None, last closed child's record]
+    stack = [[None, None, None]]
+    usages = []
+    for closing, tag, attrs, self_closing in TAG_RE.findall(template):
+        if closing:
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth][0] == tag:
+                    closed = stack[depth]
+                    del stack[depth:]
+                    stack[-1][2] = closed[1]
+                    break
+            continue
+
+        condition = CONDITION_RE.search(attrs)
+        record = None
+        if condition:
+            directive = condition.group(1)
+            record = {'kind': 'if' if directive == 'v-if' else 'branch'}
+            previous = stack[-1][2]
+            if directive != 'v-if' and previous is not None:
+                previous['kind'] = 'branch'
+        inherited = record or next((f[1] for f in reversed(stack) if f[1]), None)
+
+        if tag[0].isupper() or '-' in tag:
+            usages.append((tag, inherited))
+        if self_closing or tag.lower() in VOID_ELEMENTS:
+            stack[-1][2] = record
+            continue
+        stack.append([tag, record, None])
+
+    result = {}
+    for tag, record in usages:
+        result.setdefault(tag, []).append(record['kind'] if record else 'always')
+    return result
+
+
+def self_gated(content):
+    """True when a component's root element renders only under its own v-if."""
+    template = template_block(content)
+    if template is None:
+        return False
+    template = COMMENT_RE.sub('', template)
+    for _, tag, attrs, _ in TAG_RE.findall(template):
+        if tag.lower() in ('transition', 'teleport'):
+            continue
+        return bool(CONDITION_RE.search(attrs))
+    return False
+
+
+# =====================================================
+# ADVICE
+# =====================================================
+
+def analyze(graph, min_kb=DEFAULT_MIN_KB):
+    """
+    Find split points.
+
+    Returns:
+        Dict with 'chunks', 'routes', 'async' and 'gate' lists
+    """
+    chunk_map = chunks(graph)
+    entry_id = _rel(ENTRY.resolve())
+    report = {'chunks': [], 'routes': [], 'async': [], 'gate': []}
+
+    for root, modules in chunk_map.items():
+        size, gz = weigh(graph, modules)
+        report['chunks'].append({
+            'root': root,
+            'kind': 'entry' if root == entry_id else 'dynamic',
+            'modules': len(modules),
+            'bytes': size,
+            'gzip': gz,
+            'admin_modules': sorted(m for m in modules if m.startswith('components/admin/'))
+            if root == entry_id else [],
+        })
+
+    # Route components that main.js still imports statically
+    entry = graph[entry_id]
+    entry_source = entry['path'].read_text(encoding='utf-8')
+    routed = set(ROUTE_COMPONENT_RE.findall(entry_source))
+    for imp in entry['imports']:
+        if not imp['dynamic'] and imp['name'] in routed and imp['target'].endswith('.vue'):
+            saved = chunk_map[entry_id] - static_closure(graph, entry_id, (entry_id, imp['target']))
+            size, gz = weigh(graph, saved)
+            report['routes'].append({
+                'file': entry_id, 'component': imp['name'], 'target': imp['target'],
+                'specifier': imp['specifier'], 'bytes': size, 'gzip': gz,
+            })
+
+    for parent_id, parent in graph.items():
+        if not parent_id.endswith('.vue') or parent.get('missing'):
+            continue
+        content = parent['path'].read_text(encoding='utf-8')
+        usages = component_usages(content)
+        homes = [root for root, modules in chunk_map.items() if parent_id in modules]
+
+        for imp in parent['imports']:
+            if imp['dynamic'] or not imp['name'] or not imp['target'].endswith('.vue'):
+                continue
+            kinds = usages.get(imp['name'], []) + usages.get(_kebab(imp['name']), [])
+            if not kinds:
+                continue
+
+            # Weigh the split in whichever chunk it helps most
+            best = (0, 0, None)
+            for root in homes:
+                saved = chunk_map[root] - static_closure(graph, root, (parent_id, imp['target']))
+                size, gz = weigh(graph, saved)
+                if gz > best[1]:
+                    best = (size, gz, root)
+            size, gz, root = best
+            if gz < min_kb * 1024:
+                continue
+
+            advice = {
+                'file': parent_id, 'component': imp['name'], 'target': imp['target'],
+                'specifier': imp['specifier'], 'chunk': root, 'bytes': size, 'gzip': gz,
+            }
+            if 'always' not in kinds:
+                advice['usage'] = 'branch' if set(kinds) == {'branch'} else 'if'
+                report['async'].append(advice)
+            elif self_gated(graph[imp['target']]['path'].read_text(encoding='utf-8')):
+                report['gate'].append(advice)
+
+    for key in ('routes', 'async', 'gate'):
+        report[key].sort(key=lambda a: a['gzip'], reverse=True)
+    return report
+
+
+# =====================================================
+# REWRITING
+# =====================================================
+
+def _rewrite_imports(source, advices, make_line):
+    """Drop each advised static import and declare its lazy replacement after the imports."""
+    found = []
+    for advice in advices:
+        pattern = re.compile(
+            r'^[ \t]*import\s+' + re.escape(advice['component'])
+            + r'\s+from\s*([\'"])' + re.escape(advice['specifier']) + r'\1[ \t]*;?[ \t]*\n?',
+            re.MULTILINE,
+        )
+        match = pattern.search(source)
+        if match:
+            found.append((match.start(), match.end(), advice))
+    if not found:
+        return source, 0
+
+    # Cut from the bottom up so earlier offsets stay valid; declare in source order
+    found.sort(key=lambda item: item[0])
+    for start, end, _ in reversed(found):
+        source = source[:start] + source[end:]
+    lines = [make_line(advice) for _, _, advice in found]
+
+    last_import = None
+    for last_import in STATIC_IMPORT_RE.finditer(source):
+        pass
+    at = last_import.end() if last_import else 0
+    block = '\n'.join(lines) + '\n'
+    return source[:at] + block + source[at:], len(lines)
+
+
+def rewrite_sfc(content, advices):
+    """
+    Turn advised child components of an SFC into defineAsyncComponent() imports.
+
+    Returns:
+        Tuple of (new content, number of components rewritten)
+    """
+    block = extract_script_setup(content)
+    if block is None:
+        return content, 0
+
+    script = block
+    vue_import = VUE_IMPORT_RE.search(script)
+    if vue_import is None:
+        script = script.replace('<script setup>\n', "<script setup>\nimport { defineAsyncComponent } from 'vue'\n", 1)
+    elif 'defineAsyncComponent' not in vue_import.group(1):
+        names = vue_import.group(1).strip()
+        script = (script[:vue_import.start(1)] + f" {names}, defineAsyncComponent "
+                  + script[vue_import.end(1):])
+
+    script, count = _rewrite_imports(
+        script, advices,
+        lambda a: f"const {a['component']} = defineAsyncComponent(() => import('{a['specifier']}'))",
+    )
+    if not count:
+        return content, 0
+    return content.replace(block, script, 1), count
+
+
+def rewrite_routes(content, advices):
+    """Turn statically imported route components into lazy `() => import()` routes."""
+    return _rewrite_imports(
+        content, advices,
+        lambda a: f"const {a['component']} = () => import('{a['specifier']}')",
+    )
+
+
+def apply(graph, report, only):
+    """
+    Rewrite the route and async-component recommendations in place.
+
+    Gate-then-split candidates are left alone: they need a v-if at the call
+    site, which depends on what the component's open state is.
+
+    Returns:
+        List of (file, number of imports rewritten)
+    """
+    by_file = {}
+    for advice in report['routes'] + report['async']:
+        if advice['component'] not in only:
+            continue
+        by_file.setdefault(advice['file'], []).append(advice)
+
+    changed = []
+    for module_id, advices in sorted(by_file.items()):
+        path = graph[module_id]['path']
+        content = path.read_text(encoding='utf-8')
+        if path.suffix == '.vue':
+            content, count = rewrite_sfc(content, advices)
+        else:
+            content, count = rewrite_routes(content, advices)
+        if count:
+            path.write_text(content, encoding='utf-8')
+            changed.append((module_id, count))
+    return changed
+
+
+# =====================================================
+# REPORTING
+# =====================================================
+
+def _kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def print_report(graph, report):
+    size, gz = weigh(graph, graph)
+    print(f"🧭 {len(graph)} modules in frontend/src, {_kb(size)} source (~{_kb(gz)} gzip)")
+
+    print("\nChunks")
+    for chunk in report['chunks']:
+        print(f"  {chunk['kind']:<8} {chunk['root']:<40} {_kb(chunk['bytes']):>9} "
+              f"(~{_kb(chunk['gzip'])} gzip) {chunk['modules']:>3} modules")
+        for module_id in chunk['admin_modules']:
+            print(f"  ⚠️  admin module in the entry chunk: {module_id}")
+
+    print("\nRoute-level splits")
+    if not report['routes']:
+        print("  ✅ Every route component in main.js is already lazy-loaded")
+    for advice in report['routes']:
+        print(f"  🛣️  {advice['component']} ({advice['target']}): "
+              f"moves {_kb(advice['bytes'])} (~{_kb(advice['gzip'])} gzip) out of the entry chunk")
+
+    print("\nAsync components (rendered only under v-if)")
+    if not report['async']:
+        print("  ✅ Nothing worth splitting")
+    for advice in report['async']:
+        usage = 'v-if/v-else branch' if advice['usage'] == 'branch' else 'lone v-if'
+        print(f"  ⚡ {advice['file']} → {advice['component']}: {_kb(advice['bytes'])} "
+              f"(~{_kb(advice['gzip'])} gzip) out of {advice['chunk']} [{usage}]")
+
+    if report['gate']:
+        print("\nGate, then split (always mounted, hidden by their own v-if)")
+        for advice in report['gate']:
+            print(f"  💤 {advice['file']} → {advice['component']}: {_kb(advice['bytes'])} "
+                  f"(~{_kb(advice['gzip'])} gzip) out of {advice['chunk']}")
+
+
+def to_json(graph, report):
+    return {
+        'modules': {
+            module_id: {
+                'bytes': node['bytes'],
+                'gzip': node['gzip'],
+                'imports': [{'target': i['target'], 'dynamic': i['dynamic']} for i in node['imports']],
+                'packages': sorted(set(node['packages'])),
+            }
+            for module_id, node in sorted(graph.items())
+        },
+        **report,
+    }
+
+
+def main():
+    argv = setup('analyze_vue_splits', sys.argv)
+    parser = argparse.ArgumentParser(
+        description="Report code-splitting opportunities in the Vue frontend"
+    )
+    parser.add_argument('--json', action='store_true', help="Print the module graph and advice as JSON")
+    parser.add_argument('--min-kb', type=float, default=DEFAULT_MIN_KB,
+                        help=f"Smallest split worth reporting, in estimated gzip KB (default: {DEFAULT_MIN_KB:g})")
+    parser.add_argument('--apply', nargs='+', metavar='COMPONENT',
+                        help="Rewrite these components' imports to load lazily (see the report)")
+    args = parser.parse_args(argv[1:])
+    as_json = args.json
+    only = set(args.apply) if args.apply else None
+
+    with span('build graph'):
+        graph = build_graph()
+    with span('analyze', modules=len(graph)):
+        report = analyze(graph, args.min_kb)
+
+    if as_json:
+        print(json.dumps(to_json(graph, report), indent=2))
+    else:
+        print_report(graph, report)
+
+    if only is not None:
+        with span('apply'):
+            changed = apply(graph, report, only)
+        out = sys.stderr if as_json else sys.stdout
+        print(file=out)
+        if not changed:
+            print("Nothing to rewrite", file=out)
+        for module_id, count in changed:
+            print(f"✏️  {module_id}: {count} import(s) made lazy", file=out)
+
+
+if __name__ == "__main__":
+    main()
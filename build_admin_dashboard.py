@@ -1,14 +1,10 @@
-import re
+import sys
+from pathlib import Path
 
-with open('frontend/src/views/AdminDashboard.vue', 'r') as f:
-    content = f.read()
-
-script_match = re.search(r'(<script setup>.*?</script>)', content, re.DOTALL)
-if not script_match:
-    print("Could not find script block!")
-    exit(1)
-
-script_content = script_match.group(1)
+# Shared timing instrumentation and SFC helpers live with the skill tooling scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent / '.agent' / 'skills' / 'skill-creator' / 'scripts'))
+from sfc import extract_script_setup  # noqa: E402
+from timings import span, setup  # noqa: E402
 
 new_template_and_style = """
 <template>
@@ -348,8 +344,27 @@ new_template_and_style = """
 </style>
 """
 
-with open('frontend/src/views/AdminDashboard_new.vue', 'w') as f:
-    f.write(script_content)
-    f.write(new_template_and_style)
 
-print("Done generating AdminDashboard_new.vue")
+def main():
+    setup('build_admin_dashboard', sys.argv)
+
+    with span('read', path='frontend/src/views/AdminDashboard.vue'):
+        with open('frontend/src/views/AdminDashboard.vue', 'r') as f:
+            content = f.read()
+
+    with span('regex extract', bytes=len(content)):
+        script_content = extract_script_setup(content)
+    if script_content is None:
+        print("Could not find script block!")
+        sys.exit(1)
+
+    with span('file write', path='frontend/src/views/AdminDashboard_new.vue'):
+        with open('frontend/src/views/AdminDashboard_new.vue', 'w') as f:
+            f.write(script_content)
+            f.write(new_template_and_style)
+
+    print("Done generating AdminDashboard_new.vue")
+
+
+if __name__ == "__main__":
+    main()
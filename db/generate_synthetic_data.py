@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Generator - Streams production-scale rows for db/schema.sql
+
+Reads the CREATE TABLE definitions from schema.sql and writes referentially
+consistent PostgreSQL COPY files, one per table, plus a load.sql that loads
+them in dependency order. Rows are streamed straight to disk, so memory use
+stays flat no matter how many millions of rows are requested.
+
+Product rows come from frontend/src/assets/products.json. Every other value is
+drawn from a seeded RNG, so the same --seed always produces the same files.
+
+Usage:
+    python db/generate_synthetic_data.py <output-directory> [options]
+
+Examples:
+    python db/generate_synthetic_data.py ./synthetic
+    python db/generate_synthetic_data.py ./synthetic --users 1000000 --orders 5000000 --seed 7
+    psql "$DATABASE_URL" -f db/schema.sql && psql "$DATABASE_URL" -f ./synthetic/load.sql
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+
+
+DB_DIR = Path(__file__).resolve().parent
+DEFAULT_SCHEMA = DB_DIR / 'schema.sql'
+DEFAULT_PRODUCTS = DB_DIR.parent / 'frontend' / 'src' / 'assets' / 'products.json'
+
+# Tables are written in this order so that foreign keys always point backwards
+TABLE_ORDER = [
+    'users',
+    'guest_users',
+    'products',
+    'orders',
+    'order_items',
+    'order_status_history',
+    'payments',
+    'wishlist',
+    'cart',
+]
+
+# Status lifecycle (see "ORDER STATUS ENUM REFERENCE" in schema.sql) and its weights
+ORDER_STATUSES = [
+    ('PENDING_VERIFICATION', 6),
+    ('PAYMENT_VERIFIED', 5),
+    ('PROCESSING', 6),
+    ('SHIPPED', 10),
+    ('DELIVERED', 60),
+    ('CANCELLED', 9),
+    ('FAILED', 4),
+]
+
+# Path each status took through the lifecycle, used to build order_status_history
+STATUS_PATHS = {
+    'PENDING_VERIFICATION': ['PENDING_VERIFICATION'],
+    'PAYMENT_VERIFIED': ['PENDING_VERIFICATION', 'PAYMENT_VERIFIED'],
+    'PROCESSING': ['PENDING_VERIFICATION', 'PAYMENT_VERIFIED', 'PROCESSING'],
+    'SHIPPED': ['PENDING_VERIFICATION', 'PAYMENT_VERIFIED', 'PROCESSING', 'SHIPPED'],
+    'DELIVERED': ['PENDING_VERIFICATION', 'PAYMENT_VERIFIED', 'PROCESSING', 'SHIPPED', 'DELIVERED'],
+    'CANCELLED': ['PENDING_VERIFICATION', 'CANCELLED'],
+    'FAILED': ['PENDING_VERIFICATION', 'FAILED'],
+}
+
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Anand', 'Anika', 'Arjun', 'Deepa', 'Divya', 'Ganesh', 'Harini', 'Ishaan',
+    'Kavya', 'Karthik', 'Lakshmi', 'Meena', 'Nikhil', 'Priya', 'Rahul', 'Ramesh', 'Saanvi', 'Santhosh',
+    'Shreya', 'Sneha', 'Suresh', 'Tara', 'Varun', 'Vikram', 'Yamini', 'Zoya',
+]
+LAST_NAMES = [
+    'Iyer', 'Kumar', 'Menon', 'Nair', 'Patel', 'Pillai', 'Rajan', 'Rao', 'Reddy', 'Sharma',
+    'Singh', 'Subramanian', 'Venkatesh', 'Krishnan', 'Murugan', 'Gupta',
+]
+CITIES = [
+    ('Chennai', 'Tamil Nadu', '600'), ('Coimbatore', 'Tamil Nadu', '641'), ('Madurai', 'Tamil Nadu', '625'),
+    ('Bengaluru', 'Karnataka', '560'), ('Mysuru', 'Karnataka', '570'), ('Kochi', 'Kerala', '682'),
+    ('Hyderabad', 'Telangana', '500'), ('Mumbai', 'Maharashtra', '400'), ('Pune', 'Maharashtra', '411'),
+    ('Delhi', 'Delhi', '110'), ('Kolkata', 'West Bengal', '700'), ('Jaipur', 'Rajasthan', '302'),
+]
+COURIERS = ['India Post', 'DTDC', 'Delhivery', 'Blue Dart', 'Professional Couriers']
+
+
+# =====================================================
+# SCHEMA PARSING
+# =====================================================
+
+CREATE_TABLE_RE = re.compile(
+    r'CREATE TABLE IF NOT EXISTS (\w+)\s*\((.*?)\n\);', re.DOTALL | re.IGNORECASE
+)
+COLUMN_RE = re.compile(r'^(\w+)\s+([A-Z]+(?:\(\d+(?:,\d+)?\))?(?:\[\])?)(.*)$', re.IGNORECASE)
+REFERENCES_RE = re.compile(r'REFERENCES\s+(\w+)\((\w+)\)', re.IGNORECASE)
+TABLE_CONSTRAINTS = ('CONSTRAINT', 'UNIQUE', 'PRIMARY', 'CHECK', 'FOREIGN')
+
+
+def parse_schema(schema_text):
+    """
+    Extract table definitions from schema.sql.
+
+    Args:
+        schema_text: Contents of the schema file
+
+    Returns:
+        Dict of table name -> list of column dicts (name, type, not_null,
+        has_default, references), in declaration order
+    """
+    tables = {}
+    for table_name, body in CREATE_TABLE_RE.findall(schema_text):
+        columns = []
+        for raw_line in body.splitlines():
+            line = raw_line.split('--', 1)[0].strip().rstrip(',')
+            if not line or line.upper().startswith(TABLE_CONSTRAINTS):
+                continue
+            match = COLUMN_RE.match(line)
+            if not match:
+                continue
+            name, col_type, rest = match.groups()
+            rest_upper = rest.upper()
+            references = REFERENCES_RE.search(rest)
+            columns.append({
+                'name': name,
+                'type': col_type.upper(),
+                'not_null': 'NOT NULL' in rest_upper or 'PRIMARY KEY' in rest_upper,
+                'has_default': 'DEFAULT' in rest_upper,
+                'references': references.groups() if references else None,
+            })
+        tables[table_name] = columns
+    return tables
+
+
+# =====================================================
+# COPY FORMATTING
+# =====================================================
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+NEEDS_ESCAPE_RE = re.compile(r'[\\\t\n\r]')
+
+
+def _escape(text):
+    """Escape backslashes and row/column delimiters for the COPY text format."""
+    return text.translate(COPY_ESCAPES) if NEEDS_ESCAPE_RE.search(text) else text
+
+
+def _array_literal(values):
+    """Format a list of strings as a PostgreSQL TEXT[] literal."""
+    items = ('"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"' for v in values)
+    return '{' + ','.join(items) + '}'
+
+
+def copy_value(value):
+    """Format a Python value for the COPY text format."""
+    # Most values are plain strings and numbers, so check those first
+    value_type = type(value)
+    if value_type is str:
+        return _escape(value)
+    if value is None:
+        return '\\N'
+    if value_type is bool:
+        return 't' if value else 'f'
+    if value_type is int or value_type is float:
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return _escape(_array_literal(value))
+    if isinstance(value, dict):
+        return _escape(json.dumps(value, separators=(',', ':')))
+    return _escape(str(value))
+
+
+class CopyWriter:
+    """Streams rows for one table into a `COPY ... FROM stdin` file."""
+
+    def __init__(self, path, table, columns):
+        self.path = path
+        self.table = table
+        self.columns = columns
+        self.rows = 0
+        self._file = open(path, 'w', encoding='utf-8', buffering=1024 * 1024)
+        self._file.write(f"COPY {table} ({', '.join(columns)}) FROM stdin;\n")
+
+    def write(self, row):
+        self._file.write('\t'.join(copy_value(row.get(c)) for c in self.columns))
+        self._file.write('\n')
+        self.rows += 1
+
+    def close(self):
+        self._file.write('\\.\n')
+        self._file.close()
+
+
+def copy_columns(table, schema_columns, generated):
+    """
+    Pick the columns to COPY for a table.
+
+    Columns the generator does not produce are left out so PostgreSQL applies
+    their DEFAULT. A NOT NULL column without a default that is neither
+    generated nor defaulted means schema.sql and this script have drifted.
+    """
+    names = []
+    for column in schema_columns:
+        if column['name'] in generated:
+            names.append(column['name'])
+        elif column['not_null'] and not column['has_default']:
+            raise ValueError(
+                f"Column {table}.{column['name']} is NOT NULL without a default "
+                f"and has no generator"
+            )
+    return names
+
+
+# =====================================================
+# PRODUCTS
+# =====================================================
+
+def product_row(product, product_id=None):
+    """
+    Map a products.json entry onto the columns of the products table.
+
+    Args:
+        product: Product dict from products.json (camelCase keys)
+        product_id: Optional UUID for the id column
+
+    Returns:
+        Dict keyed by products table column names
+    """
+    row = {
+        'slug': product['slug'],
+        'name': product['name'],
+        'description': product.get('description'),
+        'price': product['price'],
+        'compare_price': product.get('comparePrice'),
+        'category': product.get('category'),
+        'subcategory': product.get('subcategory'),
+        'images': product.get('images') or [],
+        'stock': product['stock'] if isinstance(product.get('stock'), int) else 100,
+        'is_active': product.get('isActive', True),
+        'tags': product.get('tags') or [],
+        'meta_title': product.get('metaTitle'),
+        'meta_description': product.get('metaDescription'),
+    }
+    if product_id is not None:
+        row['id'] = product_id
+    return row
+
+
+def load_catalog(products_path):
+    """Load products.json and return the parsed catalog dict."""
+    with open(products_path, 'r', encoding='utf-8') as f:
+        catalog = json.load(f)
+    if not catalog.get('products'):
+        raise ValueError(f"No products found in {products_path}")
+    return catalog
+
+
+# =====================================================
+# GENERATION
+# =====================================================
+
+class SyntheticDataGenerator:
+    """
+    Generates rows for every table in TABLE_ORDER.
+
+    IDs are derived from (seed, table, index) rather than stored, so children
+    can reference any parent row by index without keeping parents in memory.
+    """
+
+    def __init__(self, catalog, seed=42, users=10000, guests=2000, orders=50000,
+                 product_copies=1, now=None):
+        self.seed = seed
+        self.users = users
+        self.guests = guests
+        self.orders = orders
+        self.now = now or datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.rng = random.Random(seed)
+
+        # Products: the real catalog, optionally replicated with suffixed slugs
+        self.products = []
+        for copy_index in range(product_copies):
+            for product in catalog['products']:
+                product = dict(product)
+                if copy_index:
+                    product['slug'] = f"{product['slug']}-{copy_index}"
+                    product['name'] = f"{product['name']} #{copy_index}"
+                    product['id'] = f"{product['id']}-{copy_index}"
+                product['_uuid'] = self.row_id('products', len(self.products))
+                self.products.append(product)
+
+        # Zipf-like popularity: a handful of products account for most sales
+        self.product_cum_weights = list(accumulate(
+            1.0 / (rank + 1) ** 1.1 for rank in range(len(self.products))
+        ))
+        self.status_names = [s for s, _ in ORDER_STATUSES]
+        self.status_cum_weights = list(accumulate(w for _, w in ORDER_STATUSES))
+
+    def row_id(self, table, index):
+        """Deterministic UUID for the index-th row of a table."""
+        digest = hashlib.blake2b(f"{self.seed}:{table}:{index}".encode(), digest_size=16).digest()
+        return str(uuid.UUID(bytes=digest, version=4))
+
+    def _timestamp(self, max_days_ago=730):
+        """Random timestamp skewed towards the recent past."""
+        days = max_days_ago * self.rng.random() ** 2
+        return self.now - timedelta(days=days, seconds=self.rng.randrange(86400))
+
+    def _person(self):
+        first = self.rng.choice(FIRST_NAMES)
+        last = self.rng.choice(LAST_NAMES)
+        phone = f"+91{self.rng.randrange(6, 10)}{self.rng.randrange(10 ** 8, 10 ** 9)}"
+        return f"{first} {last}", phone
+
+    def _customer_index(self, population):
+        """Pick a customer with a long-tailed distribution (repeat buyers)."""
+        return int(population * self.rng.random() ** 3)
+
+    def users_rows(self):
+        for i in range(self.users):
+            name, phone = self._person()
+            created = self._timestamp()
+            yield {
+                'id': self.row_id('users', i),
+                'email': f"user{i}@example.com",
+                'name': name,
+                'phone': phone if self.rng.random() < 0.7 else None,
+                'avatar_url': f"https://avatars.example.com/{i}.png" if self.rng.random() < 0.6 else None,
+                'provider': 'google' if self.rng.random() < 0.8 else 'email',
+                'email_verified': self.rng.random() < 0.9,
+                'created_at': created,
+                'updated_at': created,
+            }
+
+    def guest_users_rows(self):
+        for i in range(self.guests):
+            name, phone = self._person()
+            verified = self.rng.random() < 0.75
+            yield {
+                'id': self.row_id('guest_users', i),
+                'email': f"guest{i}@example.com",
+                'name': name,
+                'phone': phone,
+                'is_verified': verified,
+                'verified_via': self.rng.choice(('email', 'phone')) if verified else None,
+                'created_at': self._timestamp(),
+            }
+
+    def products_rows(self):
+        for product in self.products:
+            row = product_row(product, product['_uuid'])
+            row['created_at'] = row['updated_at'] = self.now - timedelta(days=900)
+            yield row
+
+    def order_rows(self):
+        """
+        Yield (table, row) pairs for orders and all of their child rows.
+
+        Orders, items, history and payments are produced together so each
+        order's totals always match its items.
+        """
+        n_products = len(self.products)
+        for i in range(self.orders):
+            order_id = self.row_id('orders', i)
+            created = self._timestamp()
+            status = self.rng.choices(self.status_names, cum_weights=self.status_cum_weights)[0]
+            user_id = guest_id = None
+            if self.guests and (not self.users or self.rng.random() < 0.2):
+                guest_id = self.row_id('guest_users', self._customer_index(self.guests))
+            else:
+                user_id = self.row_id('users', self._customer_index(self.users))
+
+            item_count = min(1 + int(self.rng.expovariate(0.8)), n_products)
+            picked = set()
+            while len(picked) < item_count:
+                picked.add(self.rng.choices(range(n_products), cum_weights=self.product_cum_weights)[0])
+
+            subtotal = 0
+            for item_index, product_index in enumerate(sorted(picked)):
+                product = self.products[product_index]
+                quantity = 1 + int(self.rng.expovariate(1.5))
+                line_total = product['price'] * quantity
+                subtotal += line_total
+                yield 'order_items', {
+                    'id': self.row_id('order_items', f"{i}:{item_index}"),
+                    'order_id': order_id,
+                    'product_id': product['id'],
+                    'product_name': product['name'],
+                    'product_slug': product['slug'],
+                    'product_image': (product.get('images') or [None])[0],
+                    'product_price': product['price'],
+                    'quantity': quantity,
+                    'subtotal': line_total,
+                    'created_at': created,
+                }
+
+            shipping_fee = 0 if subtotal >= 500 else 50
+            discount = round(subtotal * 0.1) if self.rng.random() < 0.15 else 0
+            total = subtotal + shipping_fee - discount
+            name, phone = self._person()
+            city, state, postal_prefix = self.rng.choice(CITIES)
+
+            path = STATUS_PATHS[status]
+            step_times = [created]
+            for _ in path[1:]:
+                step_times.append(step_times[-1] + timedelta(hours=self.rng.uniform(2, 72)))
+            shipped_at = step_times[path.index('SHIPPED')] if 'SHIPPED' in path else None
+            delivered_at = step_times[path.index('DELIVERED')] if 'DELIVERED' in path else None
+
+            yield 'orders', {
+                'id': order_id,
+                'order_number': f"MKS-{created:%Y%m%d}-{i:08d}",
+                'user_id': user_id,
+                'guest_id': guest_id,
+                'status': status,
+                'total': total,
+                'subtotal': subtotal,
+                'shipping_fee': shipping_fee,
+                'discount': discount,
+                'shipping_name': name,
+                'shipping_phone': phone,
+                'shipping_email': f"order{i}@example.com",
+                'shipping_address': f"{self.rng.randrange(1, 400)}, {self.rng.choice(LAST_NAMES)} Street",
+                'shipping_city': city,
+                'shipping_state': state,
+                'shipping_postal': f"{postal_prefix}{self.rng.randrange(1000):03d}",
+                'shipping_country': 'India',
+                'tracking_number': f"TRK{i:010d}" if shipped_at else None,
+                'courier_name': self.rng.choice(COURIERS) if shipped_at else None,
+                'failure_reason': 'Payment not received' if status == 'FAILED' else None,
+                'cancellation_reason': 'Cancelled by customer' if status == 'CANCELLED' else None,
+                'created_at': created,
+                'updated_at': step_times[-1],
+                'shipped_at': shipped_at,
+                'delivered_at': delivered_at,
+            }
+
+            for step, (step_status, step_time) in enumerate(zip(path, step_times)):
+                yield 'order_status_history', {
+                    'id': self.row_id('order_status_history', f"{i}:{step}"),
+                    'order_id': order_id,
+                    'status': step_status,
+                    'note': 'Order placed' if step == 0 else None,
+                    'changed_by': 'system' if step == 0 else 'admin',
+                    'created_at': step_time,
+                }
+
+            # Payments follow the order's path: verified once it passes PAYMENT_VERIFIED,
+            # failed for FAILED orders; orders still pending or cancelled before
+            # verification have no payment yet
+            verified = 'PAYMENT_VERIFIED' in path
+            if verified or status == 'FAILED':
+                yield 'payments', {
+                    'id': self.row_id('payments', i),
+                    'order_id': order_id,
+                    'method': 'manual',
+                    'status': 'verified' if verified else 'failed',
+                    'amount': total,
+                    'currency': 'INR',
+                    'verified_by': 'admin' if verified else None,
+                    'verified_at': step_times[1] if verified else None,
+                    'created_at': created,
+                    'updated_at': step_times[1],
+                }
+
+    def _saved_products(self, table, rate):
+        """Yield wishlist/cart rows: a few distinct products for some users."""
+        for i in range(self.users):
+            if self.rng.random() >= rate:
+                continue
+            user_id = self.row_id('users', i)
+            count = min(1 + int(self.rng.expovariate(0.7)), len(self.products))
+            for slot, product in enumerate(self.rng.sample(self.products, count)):
+                data = {k: product.get(k) for k in ('id', 'slug', 'name', 'price', 'images')}
+                row = {
+                    'id': self.row_id(table, f"{i}:{slot}"),
+                    'user_id': user_id,
+                    'product_id': product['id'],
+                    'product_data': data,
+                    'created_at': self._timestamp(90),
+                }
+                if table == 'cart':
+                    row['quantity'] = 1 + int(self.rng.expovariate(1.5))
+                    row['updated_at'] = row['created_at']
+                yield row
+
+    def wishlist_rows(self):
+        return self._saved_products('wishlist', 0.3)
+
+    def cart_rows(self):
+        return self._saved_products('cart', 0.15)
+
+
+# Columns each table's generator fills in (anything else falls back to its DEFAULT)
+GENERATED_COLUMNS = {
+    'users': {'id', 'email', 'name', 'phone', 'avatar_url', 'provider', 'email_verified',
+              'created_at', 'updated_at'},
+    'guest_users': {'id', 'email', 'name', 'phone', 'is_verified', 'verified_via', 'created_at'},
+    'products': {'id', 'slug', 'name', 'description', 'price', 'compare_price', 'category',
+                 'subcategory', 'images', 'stock', 'is_active', 'tags', 'meta_title',
+                 'meta_description', 'created_at', 'updated_at'},
+    'orders': {'id', 'order_number', 'user_id', 'guest_id', 'status', 'total', 'subtotal',
+               'shipping_fee', 'discount', 'shipping_name', 'shipping_phone', 'shipping_email',
+               'shipping_address', 'shipping_city', 'shipping_state', 'shipping_postal',
+               'shipping_country', 'tracking_number', 'courier_name', 'failure_reason',
+               'cancellation_reason', 'created_at', 'updated_at', 'shipped_at', 'delivered_at'},
+    'order_items': {'id', 'order_id', 'product_id', 'product_name', 'product_slug', 'product_image',
+                    'product_price', 'quantity', 'subtotal', 'created_at'},
+    'order_status_history': {'id', 'order_id', 'status', 'note', 'changed_by', 'created_at'},
+    'payments': {'id', 'order_id', 'method', 'status', 'amount', 'currency', 'verified_by',
+                 'verified_at', 'created_at', 'updated_at'},
+    'wishlist': {'id', 'user_id', 'product_id', 'product_data', 'created_at'},
+    'cart': {'id', 'user_id', 'product_id', 'product_data', 'quantity', 'created_at', 'updated_at'},
+}
+
+
+def generate(output_dir, schema_path=DEFAULT_SCHEMA, products_path=DEFAULT_PRODUCTS, **options):
+    """
+    Write COPY files for every table plus a load.sql driver.
+
+    Args:
+        output_dir: Directory for the generated files
+        schema_path: Path to schema.sql
+        products_path: Path to products.json
+        **options: Passed to SyntheticDataGenerator (seed, users, guests, orders, product_copies)
+
+    Returns:
+        Dict of table name -> number of rows written
+    """
+    schema = parse_schema(Path(schema_path).read_text(encoding='utf-8'))
+    missing = [t for t in TABLE_ORDER if t not in schema]
+    if missing:
+        raise ValueError(f"Tables not found in {schema_path}: {', '.join(missing)}")
+    for table in TABLE_ORDER:
+        for column in schema[table]:
+            parent = column['references'] and column['references'][0]
+            if parent and TABLE_ORDER.index(parent) > TABLE_ORDER.index(table):
+                raise ValueError(f"{table}.{column['name']} references {parent}, which loads later")
+
+    generator = SyntheticDataGenerator(load_catalog(products_path), **options)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    writers = {}
+    for position, table in enumerate(TABLE_ORDER, start=1):
+        columns = copy_columns(table, schema[table], GENERATED_COLUMNS[table])
+        writers[table] = CopyWriter(output_dir / f"{position:02d}_{table}.copy.sql", table, columns)
+
+    try:
+        for table in ('users', 'guest_users', 'products'):
+            for row in getattr(generator, f"{table}_rows")():
+                writers[table].write(row)
+        for table, row in generator.order_rows():
+            writers[table].write(row)
+        for table in ('wishlist', 'cart'):
+            for row in getattr(generator, f"{table}_rows")():
+                writers[table].write(row)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    # order_initial_history would duplicate the generated order_status_history
+    # rows, so it alone is disabled while loading. Foreign-key checks stay on,
+    # and only table ownership is needed (not superuser, unlike
+    # session_replication_role). The ALTERs are transactional, so a failed
+    # load leaves the trigger enabled.
+    load_sql = [
+        '-- Generated by db/generate_synthetic_data.py',
+        f"-- seed={generator.seed} users={generator.users} guests={generator.guests} orders={generator.orders}",
+        'BEGIN;',
+        'ALTER TABLE orders DISABLE TRIGGER order_initial_history;',
+    ]
+    load_sql += [f"\\ir {writers[t].path.name}" for t in TABLE_ORDER]
+    load_sql += ['ALTER TABLE orders ENABLE TRIGGER order_initial_history;', 'COMMIT;']
+    load_sql += [f"ANALYZE {t};" for t in TABLE_ORDER]
+    (output_dir / 'load.sql').write_text('\n'.join(load_sql) + '\n', encoding='utf-8')
+
+    return {table: writer.rows for table, writer in writers.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Stream synthetic, referentially consistent COPY files for db/schema.sql"
+    )
+    parser.add_argument('output_dir', help="Directory to write the COPY files into")
+    parser.add_argument('--users', type=int, default=10000, help="Registered users (default: 10000)")
+    parser.add_argument('--guests', type=int, default=2000, help="Guest users (default: 2000)")
+    parser.add_argument('--orders', type=int, default=50000, help="Orders (default: 50000)")
+    parser.add_argument('--product-copies', type=int, default=1,
+                        help="Replicate the products.json catalog N times (default: 1)")
+    parser.add_argument('--seed', type=int, default=42, help="RNG seed (default: 42)")
+    parser.add_argument('--schema', default=DEFAULT_SCHEMA, help="Path to schema.sql")
+    parser.add_argument('--products', default=DEFAULT_PRODUCTS, help="Path to products.json")
+    args = parser.parse_args()
+
+    if args.users + args.guests == 0 and args.orders:
+        print("❌ Error: orders need at least one user or guest")
+        sys.exit(1)
+
+    print(f"🧪 Generating synthetic data into: {args.output_dir}")
+    print(f"   Seed: {args.seed}")
+    print()
+
+    try:
+        counts = generate(
+            args.output_dir,
+            schema_path=args.schema,
+            products_path=args.products,
+            seed=args.seed,
+            users=args.users,
+            guests=args.guests,
+            orders=args.orders,
+            product_copies=args.product_copies,
+        )
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    for table, rows in counts.items():
+        print(f"  {table}: {rows:,} rows")
+    print(f"\n✅ Done. Load with: psql -f {Path(args.output_dir) / 'load.sql'}")
+
+
+if __name__ == "__main__":
+    main()
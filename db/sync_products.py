@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Products Sync - Emits minimal SQL to bring the products table in line with products.json
+
+products.json is the source of truth; the products table in schema.sql is a
+copy kept for RLS queries. Instead of reseeding the whole table, this script
+diffs the catalog against a snapshot of the table and writes only the
+statements needed for rows that changed, in chunked transactions:
+
+- new slugs        -> batched INSERT ... ON CONFLICT (slug) DO UPDATE
+- changed rows     -> batched UPDATE ... FROM (VALUES ...), setting only changed columns
+- removed slugs    -> soft delete (is_active = false)
+
+The snapshot is either a CSV dump of the table:
+
+    \\copy (SELECT * FROM products) TO 'products.csv' CSV HEADER
+
+or the JSON state recorded with --record-applied. A JSON snapshot records the
+catalog's version/updatedAt, so an unchanged catalog is detected without
+diffing any rows.
+
+The JSON state describes what the table holds, so it is recorded as a separate
+step, only after the emitted SQL has been applied successfully. If the apply
+fails or never runs, the next run still diffs against the previous state, and
+the statements are idempotent, so they can simply be emitted and applied again.
+
+Usage:
+    python db/sync_products.py --snapshot <products.csv|state.json> [options]
+    python db/sync_products.py --record-applied <state.json>
+
+Examples:
+    python db/sync_products.py --snapshot products.csv --output sync.sql
+    python db/sync_products.py --snapshot db/.products-sync.json --output sync.sql \\
+        && psql -v ON_ERROR_STOP=1 -f sync.sql \\
+        && python db/sync_products.py --record-applied db/.products-sync.json
+"""
+
+import argparse
+import csv
+import json
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+from generate_synthetic_data import DEFAULT_PRODUCTS, DEFAULT_SCHEMA, load_catalog, parse_schema, product_row
+
+
+# Columns managed by the database rather than the catalog
+IGNORED_COLUMNS = {'id', 'created_at', 'updated_at'}
+
+
+# =====================================================
+# VALUE NORMALIZATION
+# =====================================================
+
+def _parse_pg_array(text):
+    """Parse a one-dimensional PostgreSQL array literal such as {a,"b c"}."""
+    text = text.strip()
+    if not text.startswith('{') or not text.endswith('}'):
+        raise ValueError(f"Not an array literal: {text!r}")
+    items, current, quoted, escaped, was_quoted = [], [], False, False, False
+    for char in text[1:-1]:
+        if escaped:
+            current.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+            was_quoted = True
+        elif char == ',' and not quoted:
+            items.append(''.join(current))
+            current, was_quoted = [], False
+        else:
+            current.append(char)
+    if current or was_quoted or items:
+        items.append(''.join(current))
+    return items
+
+
+def normalize(value, col_type):
+    """
+    Bring a catalog or snapshot value into a comparable form for its column type.
+
+    CSV dumps hand back every value as a string, JSON hands back native types;
+    both must compare equal when they describe the same row.
+    """
+    if value is None or value == '':
+        return [] if col_type.endswith('[]') else None
+    if col_type.endswith('[]'):
+        return list(value) if isinstance(value, list) else _parse_pg_array(value)
+    if col_type.startswith(('DECIMAL', 'NUMERIC')):
+        return str(Decimal(str(value)).quantize(Decimal('0.01')))
+    if col_type == 'INTEGER':
+        return int(value)
+    if col_type == 'BOOLEAN':
+        if isinstance(value, str):
+            return value.lower() in ('t', 'true', '1')
+        return bool(value)
+    return str(value)
+
+
+def normalize_row(row, column_types):
+    return {
+        name: normalize(row.get(name), col_type)
+        for name, col_type in column_types.items()
+    }
+
+
+# =====================================================
+# SNAPSHOTS
+# =====================================================
+
+def load_snapshot(path, column_types):
+    """
+    Load a products table snapshot.
+
+    Args:
+        path: CSV dump of the table or JSON state from --record-applied
+        column_types: Dict of synced column name -> SQL type
+
+    Returns:
+        Tuple of (metadata dict, dict of slug -> normalized row)
+    """
+    path = Path(path)
+    if path.suffix == '.json':
+        state = json.loads(path.read_text(encoding='utf-8'))
+        rows = state.get('rows', {})
+        meta = {'version': state.get('version'), 'updatedAt': state.get('updatedAt')}
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = {row['slug']: row for row in csv.DictReader(f)}
+        meta = {}
+    return meta, {slug: normalize_row(row, column_types) for slug, row in rows.items()}
+
+
+def write_snapshot(path, catalog, catalog_rows):
+    """
+    Record the catalog as the table's state so the next run can diff against it.
+
+    Only call this once the SQL syncing the table to this catalog has been
+    applied; a state recorded ahead of the table makes later runs skip changes.
+    """
+    state = {
+        'version': catalog.get('version'),
+        'updatedAt': catalog.get('updatedAt'),
+        'rows': catalog_rows,
+    }
+    Path(path).write_text(json.dumps(state, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+# =====================================================
+# DIFF
+# =====================================================
+
+def diff_products(catalog_rows, table_rows):
+    """
+    Compare the catalog against the table snapshot.
+
+    Args:
+        catalog_rows: Dict of slug -> normalized row from products.json
+        table_rows: Dict of slug -> normalized row from the snapshot
+
+    Returns:
+        Tuple of (new rows, list of (slug, changed columns dict), slugs to deactivate)
+    """
+    inserts, updates = [], []
+    for slug, row in catalog_rows.items():
+        current = table_rows.get(slug)
+        if current is None:
+            inserts.append(row)
+            continue
+        changed = {name: value for name, value in row.items() if current.get(name) != value}
+        if changed:
+            updates.append((slug, changed))
+    removed = sorted(
+        slug for slug, row in table_rows.items()
+        if slug not in catalog_rows and row.get('is_active') is not False
+    )
+    return inserts, updates, removed
+
+
+# =====================================================
+# SQL EMISSION
+# =====================================================
+
+def sql_literal(value, col_type):
+    """Render a normalized value as a typed SQL literal."""
+    if value is None:
+        return f"NULL::{col_type}"
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, list):
+        items = ', '.join(sql_literal(item, 'TEXT') for item in value)
+        return f"ARRAY[{items}]::{col_type}" if value else f"'{{}}'::{col_type}"
+    quoted = "'" + str(value).replace("'", "''") + "'"
+    return quoted if col_type == 'TEXT' else f"{quoted}::{col_type}"
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_statements(inserts, updates, removed, column_types, batch_size=500):
+    """
+    Turn a diff into SQL, one transaction per batch.
+
+    Returns:
+        List of SQL statement strings, each wrapped in BEGIN/COMMIT
+    """
+    statements = []
+    columns = list(column_types)
+
+    for batch in _chunks(inserts, batch_size):
+        values = ',\n  '.join(
+            '(' + ', '.join(sql_literal(row[c], column_types[c]) for c in columns) + ')'
+            for row in batch
+        )
+        assignments = ', '.join(f"{c} = EXCLUDED.{c}" for c in columns if c != 'slug')
+        statements.append(
+            f"INSERT INTO products ({', '.join(columns)}) VALUES\n  {values}\n"
+            f"ON CONFLICT (slug) DO UPDATE SET {assignments};"
+        )
+
+    # Rows that changed the same set of columns share one UPDATE ... FROM (VALUES ...)
+    groups = {}
+    for slug, changed in updates:
+        groups.setdefault(tuple(sorted(changed)), []).append((slug, changed))
+    for changed_columns, rows in sorted(groups.items()):
+        for batch in _chunks(rows, batch_size):
+            values = ',\n  '.join(
+                '(' + ', '.join(
+                    [sql_literal(slug, 'TEXT')]
+                    + [sql_literal(changed[c], column_types[c]) for c in changed_columns]
+                ) + ')'
+                for slug, changed in batch
+            )
+            assignments = ', '.join(f"{c} = v.{c}" for c in changed_columns)
+            statements.append(
+                f"UPDATE products AS p SET {assignments}\n"
+                f"FROM (VALUES\n  {values}\n) AS v(slug, {', '.join(changed_columns)})\n"
+                f"WHERE p.slug = v.slug;"
+            )
+
+    for batch in _chunks(removed, batch_size):
+        slugs = ', '.join(sql_literal(slug, 'TEXT') for slug in batch)
+        statements.append(
+            f"UPDATE products SET is_active = false\nWHERE slug IN ({slugs}) AND is_active;"
+        )
+
+    return [f"BEGIN;\n{statement}\nCOMMIT;" for statement in statements]
+
+
+def load_catalog_rows(products_path=DEFAULT_PRODUCTS, schema_path=DEFAULT_SCHEMA):
+    """
+    Load products.json as normalized table rows.
+
+    Returns:
+        Tuple of (dict of synced column -> SQL type, catalog dict, dict of slug -> row)
+    """
+    schema = parse_schema(Path(schema_path).read_text(encoding='utf-8'))
+    column_types = {
+        column['name']: column['type']
+        for column in schema['products']
+        if column['name'] not in IGNORED_COLUMNS
+    }
+
+    catalog = load_catalog(products_path)
+    catalog_rows = {
+        product['slug']: normalize_row(product_row(product), column_types)
+        for product in catalog['products']
+    }
+    return column_types, catalog, catalog_rows
+
+
+def sync_products(snapshot_path, products_path=DEFAULT_PRODUCTS, schema_path=DEFAULT_SCHEMA,
+                  batch_size=500, force=False):
+    """
+    Diff products.json against a table snapshot.
+
+    Args:
+        snapshot_path: CSV dump or JSON state of the products table
+        products_path: Path to products.json
+        schema_path: Path to schema.sql (used for column types)
+        batch_size: Maximum rows per statement/transaction
+        force: Diff rows even when the snapshot's catalog version matches
+
+    Returns:
+        Tuple of (list of SQL statements, summary dict, catalog dict, catalog rows)
+    """
+    column_types, catalog, catalog_rows = load_catalog_rows(products_path, schema_path)
+
+    meta, table_rows = load_snapshot(snapshot_path, column_types)
+    if (not force and meta.get('version')
+            and (meta['version'], meta['updatedAt']) == (catalog.get('version'), catalog.get('updatedAt'))):
+        summary = {'inserted': 0, 'updated': 0, 'deactivated': 0, 'unchanged': len(catalog_rows)}
+        return [], summary, catalog, catalog_rows
+
+    inserts, updates, removed = diff_products(catalog_rows, table_rows)
+    statements = build_statements(inserts, updates, removed, column_types, batch_size)
+    summary = {
+        'inserted': len(inserts),
+        'updated': len(updates),
+        'deactivated': len(removed),
+        'unchanged': len(catalog_rows) - len(inserts) - len(updates),
+    }
+    return statements, summary, catalog, catalog_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Emit minimal batched SQL to sync the products table with products.json"
+    )
+    parser.add_argument('--snapshot',
+                        help="CSV dump of the products table, or JSON state from --record-applied")
+    parser.add_argument('--output', help="Write SQL to this file (default: stdout)")
+    parser.add_argument('--record-applied', metavar='STATE_JSON',
+                        help="After the emitted SQL was applied, record products.json as the "
+                             "table's state in this JSON file (emits no SQL)")
+    parser.add_argument('--batch-size', type=int, default=500, help="Rows per transaction (default: 500)")
+    parser.add_argument('--force', action='store_true', help="Diff even if the catalog version is unchanged")
+    parser.add_argument('--products', default=DEFAULT_PRODUCTS, help="Path to products.json")
+    parser.add_argument('--schema', default=DEFAULT_SCHEMA, help="Path to schema.sql")
+    args = parser.parse_args()
+    if args.record_applied and args.snapshot:
+        parser.error("--record-applied is a separate step; run it after applying the SQL")
+    if not args.record_applied and not args.snapshot:
+        parser.error("--snapshot is required")
+
+    # Status goes to stderr so the SQL can be piped straight into psql
+    log = sys.stderr
+    if args.record_applied:
+        try:
+            _, catalog, catalog_rows = load_catalog_rows(args.products, args.schema)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Error: {e}", file=log)
+            sys.exit(1)
+        write_snapshot(args.record_applied, catalog, catalog_rows)
+        print(f"✅ Recorded catalog version {catalog.get('version')} as applied: {args.record_applied}",
+              file=log)
+        return
+
+    try:
+        statements, summary, catalog, catalog_rows = sync_products(
+            args.snapshot, args.products, args.schema, args.batch_size, args.force
+        )
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error: {e}", file=log)
+        sys.exit(1)
+
+    print(f"🔄 Catalog version {catalog.get('version')} ({catalog.get('updatedAt')})", file=log)
+    print(
+        f"   Inserted: {summary['inserted']}, updated: {summary['updated']}, "
+        f"deactivated: {summary['deactivated']}, unchanged: {summary['unchanged']}",
+        file=log,
+    )
+
+    sql = '\n\n'.join(statements) + '\n' if statements else ''
+    if args.output:
+        Path(args.output).write_text(sql, encoding='utf-8')
+        print(f"✅ Wrote {len(statements)} transaction(s) to {args.output}", file=log)
+    elif sql:
+        sys.stdout.write(sql)
+    else:
+        print("✅ Products table already in sync", file=log)
+
+
+if __name__ == "__main__":
+    main()